@@ -0,0 +1,58 @@
+from functools import lru_cache
+
+from fastapi import Depends, HTTPException
+from sqlalchemy.orm import Session, raiseload
+
+from app.core.database import get_db
+from app.models.dataset import Dataset
+from app.services.storage_service import StorageService
+from app.services.analysis_service import AnalysisService
+from app.services.duckdb_service import DuckDBService
+from app.services.visualization_service import VizService
+from app.services.deep_research_service import DeepResearchService
+
+
+# Shared service instances. These services keep no per-request state, and
+# StorageService loads an embedding model on construction, so build each
+# one once per process instead of once per request.
+
+@lru_cache(maxsize=1)
+def get_storage_service() -> StorageService:
+    return StorageService()
+
+
+@lru_cache(maxsize=1)
+def get_analysis_service() -> AnalysisService:
+    return AnalysisService()
+
+
+@lru_cache(maxsize=1)
+def get_duckdb_service() -> DuckDBService:
+    return DuckDBService()
+
+
+@lru_cache(maxsize=1)
+def get_viz_service() -> VizService:
+    return VizService()
+
+
+@lru_cache(maxsize=1)
+def get_deep_research_service() -> DeepResearchService:
+    return DeepResearchService()
+
+
+def get_active_dataset(dataset_id: str, db: Session = Depends(get_db)) -> Dataset:
+    """Load a non-deleted dataset by path id or raise 404
+
+    Relationships are raiseload'ed; endpoints only use scalar columns.
+    """
+    dataset = db.query(Dataset).options(raiseload("*")).filter(
+        Dataset.id == dataset_id,
+        Dataset.deleted_at.is_(None)
+    ).first()
+
+    if not dataset:
+        raise HTTPException(404, "Dataset not found")
+
+    return dataset
+
@@ -1,40 +1,56 @@
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
 
-from app.core.database import get_db
+from app.core.cache import cache_get_json, cache_set_json
 from app.models.dataset import Dataset
 from app.services.storage_service import StorageService
 from app.services.analysis_service import AnalysisService
+from app.api.deps import get_storage_service, get_analysis_service, get_active_dataset
 
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
 
-@router.get("/datasets/{dataset_id}/describe")
-async def describe_dataset(dataset_id: str, db: Session = Depends(get_db)):
-    """Get detailed description and analysis of dataset"""
-    # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
+async def _get_description(
+    dataset: Dataset,
+    storage: StorageService,
+    analysis_service: AnalysisService
+) -> dict:
+    """Return the dataset description, computing it only when not cached
 
-    if not dataset:
-        raise HTTPException(404, "Dataset not found")
+    Keyed by updated_at so any change to the dataset invalidates the entry.
+    describe and summary share the same entry.
+    """
+    cache_key = f"describe:{dataset.id}:{int(dataset.updated_at.timestamp())}"
+    description = await cache_get_json(cache_key)
+    if description is not None:
+        return description
 
-    # Load data and schema
-    storage = StorageService()
-    analysis_service = AnalysisService()
+    def compute() -> dict:
+        df = storage.load_dataset(dataset.id)
+        schema = storage.load_schema(dataset.id)
+        return analysis_service.generate_dataset_description(df, schema)
 
-    try:
-        df = storage.load_dataset(dataset_id)
-        schema = storage.load_schema(dataset_id)
+    # Loading and describing the frame is blocking pandas work
+    description = await run_in_threadpool(compute)
 
-        # Generate analysis
-        description = analysis_service.generate_dataset_description(df, schema)
+    await cache_set_json(cache_key, description)
+    return description
+
+
+@router.get("/datasets/{dataset_id}/describe")
+async def describe_dataset(
+    dataset: Dataset = Depends(get_active_dataset),
+    storage: StorageService = Depends(get_storage_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service)
+):
+    """Get detailed description and analysis of dataset"""
+    try:
+        # Generate analysis (cached per dataset version)
+        description = await _get_description(dataset, storage, analysis_service)
         natural_text = analysis_service.generate_natural_description(description)
 
         return {
-            "dataset_id": dataset_id,
+            "dataset_id": dataset.id,
             "dataset_name": dataset.name,
             "analysis": description,
             "description_text": natural_text
@@ -45,24 +61,14 @@ async def describe_dataset(dataset_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/datasets/{dataset_id}/summary")
-async def get_dataset_summary(dataset_id: str, db: Session = Depends(get_db)):
+async def get_dataset_summary(
+    dataset: Dataset = Depends(get_active_dataset),
+    storage: StorageService = Depends(get_storage_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service)
+):
     """Get quick summary statistics"""
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
-        raise HTTPException(404, "Dataset not found")
-
-    storage = StorageService()
-    analysis_service = AnalysisService()
-
     try:
-        df = storage.load_dataset(dataset_id)
-        schema = storage.load_schema(dataset_id)
-
-        description = analysis_service.generate_dataset_description(df, schema)
+        description = await _get_description(dataset, storage, analysis_service)
 
         return {
             "overview": description["overview"],
@@ -1,41 +1,89 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, ORJSONResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 import pandas as pd
+import orjson
+import os
+import contextlib
+import shutil
+import tempfile
 import uuid
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
 from app.models.dataset import Dataset, SourceType, DatasetStatus
 from app.schemas.dataset import DatasetResponse, DatasetPreviewResponse, SchemaResponse
 from app.services.storage_service import StorageService
 from app.services.analysis_service import AnalysisService
+from app.api.deps import get_storage_service, get_analysis_service, get_active_dataset
 
 router = APIRouter(prefix="/datasets", tags=["datasets"])
 
 
+def _ingest_upload(dataset_id: str, temp_path: str, source_type: SourceType, storage: StorageService):
+    """Convert an uploaded file to Parquet + schema + embeddings and mark the dataset READY
+
+    Runs as a background task, so it uses its own session.
+    """
+    db = SessionLocal()
+    try:
+        dataset = db.query(Dataset).filter(Dataset.id == dataset_id).first()
+        if dataset is None or dataset.deleted_at is not None:
+            # Deleted before the task ran; nothing to ingest into
+            return
+        try:
+            if source_type == SourceType.CSV:
+                storage.save_dataset_from_csv(temp_path, dataset_id)
+                row_count = storage.load_schema(dataset_id)['total_rows']
+            else:
+                df = pd.read_excel(temp_path, engine='calamine')
+                storage.save_dataset(df, dataset_id)
+                row_count = len(df)
+
+            dataset.row_count = row_count
+            dataset.status = DatasetStatus.READY
+        except Exception as e:
+            print(f"Background ingest failed for dataset {dataset_id}: {e}")
+            dataset.status = DatasetStatus.FAILED
+        db.commit()
+    finally:
+        db.close()
+        # Never let cleanup mask an ingest error
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+
+
 @router.post("/upload", response_model=DatasetResponse)
 async def upload_dataset(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    background: bool = False,
+    db: Session = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service)
 ):
-    """Upload CSV/XLSX and create dataset"""
+    """Upload CSV/XLSX and create dataset
+
+    With background=true the file is only staged here; conversion runs after
+    the response and the dataset is returned in PROCESSING state (poll
+    GET /datasets/{id} for READY/FAILED). The response then has no analysis.
+    """
     # Create dataset ID
     dataset_id = str(uuid.uuid4())
 
-    # Save to storage (Parquet + JSON + embeddings)
-    storage = StorageService()
-    analysis_service = AnalysisService()
+    if background:
+        return await _stage_upload(dataset_id, file, background_tasks, db, storage)
 
     # Parse file
     try:
         if file.filename.endswith('.csv'):
             # Save CSV to temp file for DuckDB processing (memory efficient)
-            import tempfile
-            import os
-
             with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.csv') as tmp:
-                content = await file.read()
-                tmp.write(content)
+                # Stream in 1 MB chunks instead of buffering the whole upload
+                await run_in_threadpool(shutil.copyfileobj, file.file, tmp, 1024 * 1024)
                 temp_csv_path = tmp.name
 
             try:
@@ -48,9 +96,7 @@ async def upload_dataset(
                 row_count = schema['total_rows']
 
                 # For analysis, we still need a sample in pandas (just first 1000 rows)
-                df_sample = pd.read_parquet(paths['parquet_path'], engine='pyarrow')
-                if len(df_sample) > 1000:
-                    df_sample = df_sample.head(1000)
+                df_sample, _ = storage.load_dataset_head(dataset_id, 1000)
 
                 dataset_description = analysis_service.generate_dataset_description(df_sample, schema)
                 natural_description = analysis_service.generate_natural_description(dataset_description)
@@ -59,8 +105,9 @@ async def upload_dataset(
                 os.unlink(temp_csv_path)
 
         elif file.filename.endswith('.xlsx'):
-            # For XLSX, still use pandas (no memory-efficient alternative)
-            df = pd.read_excel(file.file)
+            # For XLSX, still use pandas; the Rust calamine reader is much
+            # faster and lighter than the default openpyxl engine
+            df = await run_in_threadpool(pd.read_excel, file.file, engine='calamine')
             source_type = SourceType.XLSX
 
             paths = storage.save_dataset(df, dataset_id)
@@ -104,32 +151,63 @@ async def upload_dataset(
     return response
 
 
-@router.get("/{dataset_id}", response_model=DatasetResponse)
-async def get_dataset(dataset_id: str, db: Session = Depends(get_db)):
-    """Get dataset metadata"""
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
+async def _stage_upload(
+    dataset_id: str,
+    file: UploadFile,
+    background_tasks: BackgroundTasks,
+    db: Session,
+    storage: StorageService
+) -> dict:
+    """Write the upload to a temp file, create a PROCESSING dataset and queue ingestion"""
+    if file.filename.endswith('.csv'):
+        source_type, suffix = SourceType.CSV, '.csv'
+    elif file.filename.endswith('.xlsx'):
+        source_type, suffix = SourceType.XLSX, '.xlsx'
+    else:
+        raise HTTPException(400, "Only CSV and XLSX files supported")
+
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix=suffix) as tmp:
+        await run_in_threadpool(shutil.copyfileobj, file.file, tmp, 1024 * 1024)
+        temp_path = tmp.name
+
+    base_path = f"{settings.DATASETS_DIR}/{dataset_id}"
+    dataset = Dataset(
+        id=dataset_id,
+        name=file.filename,
+        parquet_path=f"{base_path}/data.parquet",
+        schema_path=f"{base_path}/schema.json",
+        embedding_path=f"{settings.EMBEDDINGS_DIR}/{dataset_id}_embeddings.bin",
+        source_type=source_type,
+        status=DatasetStatus.PROCESSING,
+        row_count=0,
+        size_bytes=file.size or 0
+    )
+    db.add(dataset)
+    db.commit()
+    db.refresh(dataset)
 
-    if not dataset:
-        raise HTTPException(404, "Dataset not found")
+    background_tasks.add_task(_ingest_upload, dataset_id, temp_path, source_type, storage)
 
+    return {
+        **dataset.__dict__,
+        "analysis": None,
+        "description_text": None
+    }
+
+
+@router.get("/{dataset_id}", response_model=DatasetResponse)
+def get_dataset(dataset: Dataset = Depends(get_active_dataset)):
+    """Get dataset metadata"""
     return dataset
 
 
 @router.get("/{dataset_id}/schema", response_model=SchemaResponse)
-async def get_schema(dataset_id: str, db: Session = Depends(get_db)):
+def get_schema(
+    dataset_id: str,
+    dataset: Dataset = Depends(get_active_dataset),
+    storage: StorageService = Depends(get_storage_service)
+):
     """Get dataset schema with stats"""
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
-        raise HTTPException(404, "Dataset not found")
-
-    storage = StorageService()
     try:
         schema = storage.load_schema(dataset_id)
         return schema
@@ -138,45 +216,40 @@ async def get_schema(dataset_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{dataset_id}/preview", response_model=DatasetPreviewResponse)
-async def preview_dataset(
+def preview_dataset(
     dataset_id: str,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    dataset: Dataset = Depends(get_active_dataset),
+    storage: StorageService = Depends(get_storage_service)
 ):
     """Get first N rows"""
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
-        raise HTTPException(404, "Dataset not found")
-
-    storage = StorageService()
     try:
-        df = storage.load_dataset(dataset_id)
-        preview = df.head(limit)
-
-        return {
-            "columns": preview.columns.tolist(),
-            "rows": preview.to_dict('records'),
-            "total_rows": len(df)
-        }
+        columns, rows, total_rows = storage.load_dataset_preview(dataset_id, limit)
+
+        # Encode the Arrow-produced rows directly instead of going through
+        # FastAPI's jsonable_encoder
+        return Response(
+            content=orjson.dumps(
+                {
+                    "columns": columns,
+                    "rows": rows,
+                    "total_rows": total_rows
+                },
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS
+            ),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(500, f"Failed to load preview: {str(e)}")
 
 
 @router.delete("/{dataset_id}")
-async def delete_dataset(dataset_id: str, db: Session = Depends(get_db)):
+def delete_dataset(
+    dataset: Dataset = Depends(get_active_dataset),
+    db: Session = Depends(get_db)
+):
     """Soft delete dataset"""
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
-        raise HTTPException(404, "Dataset not found")
-
     dataset.deleted_at = datetime.utcnow()
     db.commit()
 
@@ -184,10 +257,28 @@ async def delete_dataset(dataset_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=list[DatasetResponse])
-async def list_datasets(db: Session = Depends(get_db)):
-    """List all active datasets"""
-    datasets = db.query(Dataset).filter(
+def list_datasets(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """List active datasets, newest first"""
+    # Select only the DatasetResponse columns instead of hydrating ORM objects
+    stmt = select(
+        Dataset.id,
+        Dataset.name,
+        Dataset.description,
+        Dataset.source_type,
+        Dataset.status,
+        Dataset.row_count,
+        Dataset.size_bytes,
+        Dataset.dataset_version,
+        Dataset.created_at,
+        Dataset.updated_at
+    ).where(
         Dataset.deleted_at.is_(None)
-    ).order_by(Dataset.created_at.desc()).all()
+    ).order_by(Dataset.created_at.desc()).limit(limit).offset(offset)
+
+    rows = db.execute(stmt).mappings().all()
 
-    return datasets
+    return ORJSONResponse([dict(row) for row in rows])
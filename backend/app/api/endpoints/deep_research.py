@@ -1,21 +1,249 @@
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import StreamingResponse, Response
+from fastapi import APIRouter, HTTPException, Depends, Request, Query, Header
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, Response, ORJSONResponse
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Optional, Dict, Any, List, Set, Union
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor
+from app.core.cache import cache_get_json, cache_set_json
 from app.core.database import get_db
+from app.api.deps import get_deep_research_service
+from app.core.dataset_exists import dataset_version
 from app.services.deep_research_service import DeepResearchService
-from app.services.infographic_service import InfographicService
-from app.models.dataset import Dataset
+from app.services.research_cache import (
+    research_cache_key,
+    CachedResearch,
+    get_cached_research,
+    set_cached_research,
+    StageCache
+)
 import logging
-import json
+import orjson
 import asyncio
+import anyio
 import base64
+import time
+import uuid
+import os
+import atexit
+import multiprocessing
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Research payloads carry large nested results; encode the JSON endpoints
+# with orjson (numpy values included) instead of the stdlib encoder
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# How often the stream checks for a disconnected client while idle
+_DISCONNECT_POLL_SECONDS = 1.0
+
+# In-flight /analyze runs by result cache key, so concurrent identical
+# requests share one pipeline run
+_inflight_research: Dict[str, asyncio.Task] = {}
+
+# Idle time after which the stream sends an SSE comment so proxies with
+# idle timeouts don't drop long-running research
+_KEEPALIVE_SECONDS = 15.0
+_SSE_KEEPALIVE = b": keepalive\n\n"
+
+# /analyze-stream runs by request key; later subscribers replay and follow
+# the same run instead of starting a new one
+_stream_registry: Dict[str, "_StreamRecorder"] = {}
+
+# How long a finished stream stays available for replay
+_STREAM_REPLAY_TTL_SECONDS = 300
+
+# Background infographic renders (infographic_async requests). Job state
+# lives in Redis so a poll can land on any worker; this set only keeps the
+# running tasks referenced until they finish.
+_infographic_tasks: Set[asyncio.Task] = set()
+_INFOGRAPHIC_JOB_TTL_SECONDS = 600
+
+# Set when a response answers from the cache entry of a paraphrased
+# question; main_question then carries that earlier wording
+_PARAPHRASE_HEADER = "X-Research-Cache"
+# /analyze-batch: comma-separated indexes of the answers that are paraphrase hits
+_BATCH_PARAPHRASE_HEADER = "X-Research-Paraphrase-Hits"
+
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_RESULT_PREFIX = b"event: result\ndata: "
+
+
+def _sse_event(payload: Dict[str, Any]) -> bytes:
+    """Encode one SSE data frame; numpy values are serialized natively"""
+    return _SSE_PREFIX + orjson.dumps(
+        payload,
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ) + _SSE_SUFFIX
+
+
+def _model_response(model: BaseModel) -> Response:
+    """Serialize a response model once with pydantic's compiled encoder
+
+    Returning a Response skips FastAPI's re-validation and jsonable_encoder
+    pass; the route's response_model still documents the schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _get_dataset_version(db: Session, dataset_id: str) -> datetime:
+    """Return a dataset's updated_at, which the research caches key on, or raise 404"""
+    updated_at = dataset_version(db, dataset_id)
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail=f"Dataset {dataset_id} not found")
+    return updated_at
+
+
+# Result fields sent as individual 'partial' events before 'complete'
+_STREAMED_RESULT_FIELDS = ('direct_answer', 'key_findings', 'visualizations', 'follow_up_questions')
+
+
+def _result_events(result: Dict[str, Any]):
+    """Split a finished research result into a sequence of SSE payloads
+
+    The answer, each finding and each visualization go out as separate
+    'partial' events so clients can render progressively and no single
+    event carries every base64 chart. The closing 'complete' event holds
+    the remaining fields.
+    """
+    yield {'type': 'partial', 'field': 'direct_answer', 'value': result.get('direct_answer')}
+    for finding in result.get('key_findings', []):
+        yield {'type': 'partial', 'field': 'key_findings', 'value': finding}
+    for visualization in result.get('visualizations', []):
+        yield {'type': 'partial', 'field': 'visualizations', 'value': visualization}
+    yield {'type': 'partial', 'field': 'follow_up_questions', 'value': result.get('follow_up_questions', [])}
+    yield {
+        'type': 'complete',
+        'result': {k: v for k, v in result.items() if k not in _STREAMED_RESULT_FIELDS}
+    }
+
+
+class _StreamRecorder:
+    """Encoded SSE frames of one research run, shared by all its subscribers
+
+    Frames are kept in order for the life of the run; each subscriber only
+    tracks its read position, so a slow client never grows a buffer of its own.
+    """
+
+    def __init__(self):
+        self.frames: List[bytes] = []
+        self.done = False
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Condition()
+
+    async def append(self, frame: bytes):
+        async with self._changed:
+            self.frames.append(frame)
+            self._changed.notify_all()
+
+    async def finish(self):
+        async with self._changed:
+            self.done = True
+            self._changed.notify_all()
+
+    async def wait_for_frames(self, position: int, timeout: float) -> bool:
+        """Wait for a frame beyond position or the end of the run; False on timeout"""
+        async with self._changed:
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait_for(lambda: len(self.frames) > position or self.done),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+
+def _evict_stream(key: str, recorder: _StreamRecorder):
+    """Drop a recorder from the registry unless a newer run replaced it"""
+    if _stream_registry.get(key) is recorder:
+        del _stream_registry[key]
+
+
+async def _record_research(key: str,
+                           recorder: _StreamRecorder,
+                           service: DeepResearchService,
+                           **research_kwargs):
+    """Run the pipeline, recording progress and result sections as SSE frames
+
+    Only successful runs stay registered for replay.
+    """
+    try:
+        async for update in service.research_stream(**research_kwargs):
+            if update.get('type') != 'complete':
+                await recorder.append(_sse_event({**update, 'total_stages': 6}))
+                continue
+
+            for event in _result_events(update['result']):
+                await recorder.append(_sse_event(event))
+                # orjson holds the GIL, so a worker thread wouldn't free the loop;
+                # yielding between sections lets other streams run between encodes
+                await asyncio.sleep(0)
+    except Exception as e:
+        logger.error(f"Deep research error: {str(e)}", exc_info=True)
+        await recorder.append(_sse_event({'type': 'error', 'error': str(e)}))
+        await recorder.finish()
+        # Current subscribers still get the error; new ones start a fresh run
+        _evict_stream(key, recorder)
+        return
+
+    await recorder.finish()
+    asyncio.get_running_loop().call_later(
+        _STREAM_REPLAY_TTL_SECONDS, _evict_stream, key, recorder
+    )
+
+
+# Stage lists reported by /execute-plan; shared by every response
+_PLAN_STAGES_WITH_KNOWLEDGE = [
+    'Question decomposition (user-edited)',
+    'Schema mapping',
+    'Query execution',
+    'Knowledge enrichment',
+    'Insight synthesis',
+    'Follow-up generation'
+]
+_PLAN_STAGES_WITHOUT_KNOWLEDGE = [
+    'Question decomposition (user-edited)',
+    'Schema mapping',
+    'Query execution',
+    'Knowledge enrichment (skipped)',
+    'Insight synthesis',
+    'Follow-up generation'
+]
+
+
+@lru_cache(maxsize=1)
+def _get_infographic_pool() -> ProcessPoolExecutor:
+    """Return the process pool that renders infographics, starting it on first use
+
+    Rendering is CPU-bound reportlab/matplotlib work that holds the GIL (and
+    pyplot keeps global figure state), so it runs in separate processes
+    instead of on the event loop or a request thread. Workers are spawned
+    rather than forked, as this process already runs threads.
+    """
+    pool = ProcessPoolExecutor(
+        max_workers=max(1, (os.cpu_count() or 2) // 2),
+        mp_context=multiprocessing.get_context('spawn')
+    )
+    atexit.register(pool.shutdown)
+    return pool
+
+
+def _infographic_job(template: str, research_result: Dict[str, Any], **options) -> Future:
+    # Imported here so reportlab, matplotlib and PIL stay off the API's
+    # startup path; the workers import them instead
+    from app.services.infographic_service import render_infographic
+    return _get_infographic_pool().submit(render_infographic, template, research_result, **options)
+
+
+async def _render_infographic(template: str, research_result: Dict[str, Any], **options) -> Dict[str, Any]:
+    """Render an infographic in the process pool without blocking the event loop"""
+    return await asyncio.wrap_future(_infographic_job(template, research_result, **options))
 
 
 class DeepResearchRequest(BaseModel):
@@ -23,13 +251,16 @@ class DeepResearchRequest(BaseModel):
     dataset_id: str = Field(..., description="Dataset ID to analyze")
     question: str = Field(..., description="Main research question")
     max_sub_questions: int = Field(default=10, ge=1, le=20, description="Maximum sub-questions to generate")
+    sub_question_concurrency: int = Field(default=8, ge=1, le=20, description="Sub-questions answered in parallel")
     enable_python: bool = Field(default=True, description="Enable Python analysis")
     enable_world_knowledge: bool = Field(default=True, description="Enable world knowledge enrichment")
     verbose_mode: bool = Field(default=True, description="Generate comprehensive multi-page analysis")
+    cache_salt: Optional[str] = Field(default=None, description="Isolates cached results, e.g. per experiment; requests only share cache entries with the same salt")
     generate_infographic: bool = Field(default=False, description="Auto-generate infographic")
     infographic_format: str = Field(default='pdf', description="Infographic format: 'pdf' or 'png'")
     infographic_color_scheme: str = Field(default='professional', description="Color scheme: 'professional', 'modern', or 'corporate'")
     infographic_generation_method: str = Field(default='template', description="Generation method: 'template' (free) or 'ai' (Gemini Nano Banana Pro, paid)")
+    infographic_async: bool = Field(default=False, description="Render the infographic in the background and return a job id to poll at GET /infographic/{job_id}")
 
 
 class DeepResearchResponse(BaseModel):
@@ -57,6 +288,39 @@ class DeepResearchResponse(BaseModel):
     technical_appendix: Optional[Dict[str, Any]] = None
 
 
+_research_responses = TypeAdapter(List[DeepResearchResponse])
+
+
+class _LLMResponseFields(BaseModel):
+    """DeepResearchResponse fields built from LLM JSON
+
+    Success responses skip validation with model_construct, so these are
+    validated on their own first; malformed model output then fails the
+    request instead of being sent in the wrong shape.
+    """
+    direct_answer: str
+    key_findings: List[str]
+    supporting_details: List[Dict[str, Any]]
+    follow_up_questions: List[str]
+    data_coverage: Dict[str, Any]
+
+
+def _validated_llm_fields(**fields: Any) -> Dict[str, Any]:
+    return dict(_LLMResponseFields.model_validate(fields))
+
+
+class BatchResearchRequest(BaseModel):
+    """Request for deep research on several related questions"""
+    dataset_id: str = Field(..., description="Dataset ID to analyze")
+    questions: List[str] = Field(..., min_length=1, max_length=10, description="Research questions")
+    max_sub_questions: int = Field(default=10, ge=1, le=20, description="Maximum sub-questions to generate per question")
+    sub_question_concurrency: int = Field(default=8, ge=1, le=20, description="Sub-questions answered in parallel per question")
+    enable_python: bool = Field(default=True, description="Enable Python analysis")
+    enable_world_knowledge: bool = Field(default=True, description="Enable world knowledge enrichment")
+    verbose_mode: bool = Field(default=True, description="Generate comprehensive multi-page analysis")
+    cache_salt: Optional[str] = Field(default=None, description="Isolates cached results, e.g. per experiment; requests only share cache entries with the same salt")
+
+
 class PlanRequest(BaseModel):
     """Request for research plan generation"""
     dataset_id: str = Field(..., description="Dataset ID to analyze")
@@ -74,11 +338,25 @@ class PlanResponse(BaseModel):
     error: Optional[str] = None
 
 
+class _PlanSubQuestion(BaseModel):
+    """One editable sub-question in a plan; checks the decomposition the LLM returned"""
+    id: str
+    question: str
+    intent_type: str
+    desired_output: str
+    priority: int
+    editable: bool
+
+
+_plan_sub_questions = TypeAdapter(List[_PlanSubQuestion])
+
+
 class ExecutePlanRequest(BaseModel):
     """Request to execute research with edited plan"""
     dataset_id: str = Field(..., description="Dataset ID to analyze")
     main_question: str = Field(..., description="Main research question")
     sub_questions: List[Dict[str, Any]] = Field(..., description="User-edited sub-questions")
+    sub_question_concurrency: int = Field(default=8, ge=1, le=20, description="Sub-questions answered in parallel")
     enable_python: bool = Field(default=True, description="Enable Python analysis")
     enable_world_knowledge: bool = Field(default=True, description="Enable world knowledge enrichment")
     verbose_mode: bool = Field(default=True, description="Generate comprehensive multi-page analysis")
@@ -86,6 +364,7 @@ class ExecutePlanRequest(BaseModel):
     infographic_format: str = Field(default='pdf', description="Infographic format: 'pdf' or 'png'")
     infographic_color_scheme: str = Field(default='professional', description="Color scheme: 'professional', 'modern', or 'corporate'")
     infographic_generation_method: str = Field(default='template', description="Generation method: 'template' (free) or 'ai' (Gemini Nano Banana Pro, paid)")
+    infographic_async: bool = Field(default=False, description="Render the infographic in the background and return a job id to poll at GET /infographic/{job_id}")
 
 
 class InfographicRequest(BaseModel):
@@ -107,10 +386,112 @@ class InfographicResponse(BaseModel):
     error: Optional[str] = None
 
 
+# Requests that carry the generate_infographic / infographic_* options
+_InfographicOptions = Union[DeepResearchRequest, ExecutePlanRequest]
+
+
+def _analysis_cache_params(request: Union[DeepResearchRequest, BatchResearchRequest]) -> Dict[str, Any]:
+    """Request options that change a research result, for its cache key"""
+    return {
+        'max_sub_questions': request.max_sub_questions,
+        'enable_python': request.enable_python,
+        'enable_world_knowledge': request.enable_world_knowledge,
+        'verbose_mode': request.verbose_mode,
+        'cache_salt': request.cache_salt
+    }
+
+
+async def _auto_infographic(request: _InfographicOptions, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Render the infographic a request asked for, or None if not requested or it failed"""
+    if not request.generate_infographic:
+        return None
+
+    try:
+        logger.info(f"Auto-generating infographic using {request.infographic_generation_method} method...")
+        infographic_result = await _render_infographic(
+            request.infographic_color_scheme,
+            result,
+            format=request.infographic_format,
+            include_charts=True,
+            include_visualizations=True,
+            generation_method=request.infographic_generation_method
+        )
+        infographic_data = {
+            'data': infographic_result['data'],
+            'format': infographic_result['format'],
+            'filename': infographic_result['filename'],
+            'size_bytes': infographic_result['size_bytes']
+        }
+        if request.infographic_generation_method == 'ai':
+            infographic_data['generation_method'] = 'ai'
+            infographic_data['model'] = 'google/gemini-3-pro-image-preview'
+        logger.info(f"Infographic generated: {infographic_result['filename']}")
+        return infographic_data
+    except Exception as e:
+        logger.error(f"Infographic generation failed: {str(e)}", exc_info=True)
+        # Continue without infographic - don't fail the whole request
+        return None
+
+
+def _infographic_job_key(job_id: str) -> str:
+    return f"infographic_job:{job_id}"
+
+
+async def _run_infographic_job(job_id: str, request: _InfographicOptions, result: Dict[str, Any]):
+    infographic_data = await _auto_infographic(request, result)
+    state = {'status': 'failed'} if infographic_data is None else {'status': 'complete', **infographic_data}
+    await cache_set_json(_infographic_job_key(job_id), state, ttl=_INFOGRAPHIC_JOB_TTL_SECONDS)
+
+
+async def _start_infographic_job(request: _InfographicOptions, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Render an infographic in the background; returns the handle to poll"""
+    job_id = str(uuid.uuid4())
+    # Recorded before the render starts so an immediate poll finds the job
+    await cache_set_json(
+        _infographic_job_key(job_id), {'status': 'pending'}, ttl=_INFOGRAPHIC_JOB_TTL_SECONDS
+    )
+    task = asyncio.create_task(_run_infographic_job(job_id, request, result))
+    _infographic_tasks.add(task)
+    task.add_done_callback(_infographic_tasks.discard)
+    return {'status': 'pending', 'job_id': job_id}
+
+
+async def _requested_infographic(request: _InfographicOptions, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The infographic field for a response: rendered inline, a job handle, or None"""
+    if request.generate_infographic and request.infographic_async:
+        return await _start_infographic_job(request, result)
+    return await _auto_infographic(request, result)
+
+
+def _analysis_response(result: Dict[str, Any], infographic_data: Optional[Dict[str, Any]]) -> DeepResearchResponse:
+    """Build the /analyze response for a finished research result
+
+    main_question is the question the result answers; for a paraphrase hit
+    that is the earlier wording, and callers flag the response as such.
+    """
+    return DeepResearchResponse.model_construct(
+        success=True,
+        main_question=result['main_question'],
+        **_validated_llm_fields(
+            direct_answer=result['direct_answer'],
+            key_findings=result['key_findings'],
+            supporting_details=result['supporting_details'],
+            data_coverage=result['data_coverage'],
+            follow_up_questions=result['follow_up_questions']
+        ),
+        visualizations=result.get('visualizations', []),
+        stages_completed=result['stages_completed'],
+        execution_time_seconds=result['execution_time_seconds'],
+        infographic=infographic_data
+    )
+
+
 @router.post("/analyze", response_model=DeepResearchResponse)
 async def deep_research_analyze(
     request: DeepResearchRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    service: DeepResearchService = Depends(get_deep_research_service),
+    x_cache_skip: Optional[str] = Header(default=None)
 ):
     """
     Perform deep research analysis on a dataset using multi-stage pipeline:
@@ -121,169 +502,343 @@ async def deep_research_analyze(
     4. World Knowledge Enrichment
     5. Synthesis & Insight Generation
     6. Follow-up Question Suggestions
+
+    Send `X-Cache-Skip: 1` to bypass the result and stage caches; the fresh
+    outputs still replace the cached ones. An answer reused from a
+    paraphrased question carries `X-Research-Cache: paraphrase`.
     """
 
     try:
         # Verify dataset exists
-        dataset = db.query(Dataset).filter(Dataset.id == request.dataset_id).first()
-        if not dataset:
-            raise HTTPException(status_code=404, detail=f"Dataset {request.dataset_id} not found")
+        dataset_updated_at = await run_in_threadpool(_get_dataset_version, db, request.dataset_id)
 
-        logger.info(f"Starting deep research for dataset {request.dataset_id}: {request.question}")
+        cache_params = _analysis_cache_params(request)
 
-        # Initialize service
-        service = DeepResearchService()
+        skip_cache = x_cache_skip == '1'
 
-        # Execute deep research
-        result = await service.research(
-            main_question=request.question,
-            dataset_id=request.dataset_id,
-            max_sub_questions=request.max_sub_questions,
-            enable_python=request.enable_python,
-            enable_world_knowledge=request.enable_world_knowledge,
-            verbose_mode=request.verbose_mode
-        )
+        async def run_research() -> CachedResearch:
+            if not skip_cache:
+                cached = await get_cached_research(
+                    request.dataset_id, dataset_updated_at, request.question, **cache_params
+                )
+                if cached is not None:
+                    logger.info(f"Deep research cache hit for dataset {request.dataset_id}: {request.question}")
+                    return cached
+
+            logger.info(f"Starting deep research for dataset {request.dataset_id}: {request.question}")
+
+            # Execute deep research
+            result = await service.research(
+                main_question=request.question,
+                dataset_id=request.dataset_id,
+                max_sub_questions=request.max_sub_questions,
+                enable_python=request.enable_python,
+                enable_world_knowledge=request.enable_world_knowledge,
+                verbose_mode=request.verbose_mode,
+                stage_cache=StageCache(
+                    request.dataset_id, dataset_updated_at, request.cache_salt, refresh=skip_cache
+                ),
+                sub_question_concurrency=request.sub_question_concurrency
+            )
 
-        logger.info(f"Deep research completed in {result.get('execution_time_seconds', 0):.2f}s")
+            logger.info(f"Deep research completed in {result.get('execution_time_seconds', 0):.2f}s")
 
-        # Optionally generate infographic
-        infographic_data = None
-        if request.generate_infographic:
-            try:
-                logger.info(f"Auto-generating infographic using {request.infographic_generation_method} method...")
-                infographic_service = InfographicService(template=request.infographic_color_scheme)
-                infographic_result = infographic_service.generate_infographic(
-                    research_result=result,
-                    format=request.infographic_format,
-                    include_charts=True,
-                    include_visualizations=True,
-                    generation_method=request.infographic_generation_method
-                )
-                infographic_data = {
-                    'data': infographic_result['data'],
-                    'format': infographic_result['format'],
-                    'filename': infographic_result['filename'],
-                    'size_bytes': infographic_result['size_bytes']
-                }
-                if request.infographic_generation_method == 'ai':
-                    infographic_data['generation_method'] = 'ai'
-                    infographic_data['model'] = 'google/gemini-3-pro-image-preview'
-                logger.info(f"Infographic generated: {infographic_result['filename']}")
-            except Exception as e:
-                logger.error(f"Infographic generation failed: {str(e)}", exc_info=True)
-                # Continue without infographic - don't fail the whole request
-
-        return DeepResearchResponse(
-            success=True,
-            main_question=result['main_question'],
-            direct_answer=result['direct_answer'],
-            key_findings=result['key_findings'],
-            supporting_details=result['supporting_details'],
-            data_coverage=result['data_coverage'],
-            follow_up_questions=result['follow_up_questions'],
-            visualizations=result.get('visualizations', []),
-            stages_completed=result['stages_completed'],
-            execution_time_seconds=result['execution_time_seconds'],
-            infographic=infographic_data
+            await set_cached_research(
+                request.dataset_id, dataset_updated_at, request.question, result, **cache_params
+            )
+            return CachedResearch(result, paraphrase=False)
+
+        # Join an identical run that is already in progress instead of starting another
+        flight_key = research_cache_key(
+            request.dataset_id, dataset_updated_at, request.question, **cache_params
         )
+        if skip_cache:
+            # Don't join a run that may be answering from the cache
+            flight_key += ':fresh'
+        research_task = _inflight_research.get(flight_key)
+        if research_task is None:
+            research_task = asyncio.create_task(run_research())
+            _inflight_research[flight_key] = research_task
+            research_task.add_done_callback(lambda _: _inflight_research.pop(flight_key, None))
+        else:
+            logger.info(f"Joining in-flight deep research for dataset {request.dataset_id}: {request.question}")
+
+        # Shielded so one caller disconnecting doesn't cancel the run for the others
+        result, paraphrase = await asyncio.shield(research_task)
+
+        # Optionally generate infographic
+        infographic_data = await _requested_infographic(request, result)
+
+        response = _model_response(_analysis_response(result, infographic_data))
+        if paraphrase:
+            response.headers[_PARAPHRASE_HEADER] = 'paraphrase'
+        return response
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Deep research failed: {str(e)}", exc_info=True)
-        return DeepResearchResponse(
+        return _model_response(DeepResearchResponse(
             success=False,
             main_question=request.question,
             direct_answer="",
             key_findings=[],
-            supporting_details={},
+            supporting_details=[],
             data_coverage={},
             follow_up_questions=[],
             visualizations=[],
             stages_completed=[],
             execution_time_seconds=0,
             error=str(e)
+        ))
+
+
+@router.post("/analyze-sse")
+async def deep_research_analyze_sse(
+    request: DeepResearchRequest,
+    x_cache_skip: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+    service: DeepResearchService = Depends(get_deep_research_service)
+):
+    """
+    Run /analyze and stream its progress using Server-Sent Events
+
+    Takes the same body as /analyze. Sends a `data:` event as each stage
+    starts, then `event: result` carrying the same DeepResearchResponse JSON
+    /analyze returns (or `event: error`). A cached result is sent as the
+    result event straight away; `X-Cache-Skip: 1` bypasses the caches and
+    `X-Research-Cache: paraphrase` flags a reused paraphrase answer, as
+    for /analyze.
+    """
+
+    # Verify dataset exists
+    dataset_updated_at = await run_in_threadpool(_get_dataset_version, db, request.dataset_id)
+    cache_params = _analysis_cache_params(request)
+
+    # Looked up before streaming starts so a paraphrase hit can set its header
+    cached = None
+    if x_cache_skip != '1':
+        cached = await get_cached_research(
+            request.dataset_id, dataset_updated_at, request.question, **cache_params
+        )
+
+    async def event_generator():
+        try:
+            result = cached.result if cached is not None else None
+            if result is None:
+                async for update in service.research_stream(
+                    main_question=request.question,
+                    dataset_id=request.dataset_id,
+                    max_sub_questions=request.max_sub_questions,
+                    enable_python=request.enable_python,
+                    enable_world_knowledge=request.enable_world_knowledge,
+                    verbose_mode=request.verbose_mode,
+                    stage_cache=StageCache(
+                        request.dataset_id, dataset_updated_at, request.cache_salt, refresh=x_cache_skip == '1'
+                    ),
+                    sub_question_concurrency=request.sub_question_concurrency
+                ):
+                    if update.get('type') == 'complete':
+                        result = update['result']
+                    else:
+                        yield _sse_event({**update, 'total_stages': 6})
+
+                await set_cached_research(
+                    request.dataset_id, dataset_updated_at, request.question, result, **cache_params
+                )
+
+            infographic_data = await _requested_infographic(request, result)
+            response = _analysis_response(result, infographic_data)
+            yield _SSE_RESULT_PREFIX + response.model_dump_json().encode() + _SSE_SUFFIX
+        except Exception as e:
+            logger.error(f"Deep research failed: {str(e)}", exc_info=True)
+            yield b"event: error\n" + _sse_event({'error': str(e)})
+
+    headers = {
+        "Cache-Control": "no-cache",
+        # Stop nginx-style proxies from buffering the event stream
+        "X-Accel-Buffering": "no",
+    }
+    if cached is not None and cached.paraphrase:
+        headers[_PARAPHRASE_HEADER] = 'paraphrase'
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers=headers
+    )
+
+
+@router.post("/analyze-batch", response_model=List[DeepResearchResponse])
+async def deep_research_analyze_batch(
+    request: BatchResearchRequest,
+    db: Session = Depends(get_db),
+    service: DeepResearchService = Depends(get_deep_research_service)
+):
+    """
+    Run deep research for several related questions on one dataset
+
+    Cached answers are reused per question; the rest are decomposed, then
+    classified against the schema together in one pass before running
+    concurrently. Returns one response per question, in order;
+    `X-Research-Paraphrase-Hits` lists the indexes answered from a
+    paraphrased question's cache entry.
+    """
+
+    dataset_updated_at = await run_in_threadpool(_get_dataset_version, db, request.dataset_id)
+
+    cache_params = _analysis_cache_params(request)
+    cached = await asyncio.gather(*[
+        get_cached_research(request.dataset_id, dataset_updated_at, q, **cache_params)
+        for q in request.questions
+    ])
+    results = [hit.result if hit is not None else None for hit in cached]
+    paraphrase_hits = [str(i) for i, hit in enumerate(cached) if hit is not None and hit.paraphrase]
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    logger.info(f"Batch deep research for dataset {request.dataset_id}: "
+                f"{len(request.questions) - len(missing)} cached, {len(missing)} to run")
+
+    if missing:
+        fresh = await service.research_batch(
+            [request.questions[i] for i in missing],
+            request.dataset_id,
+            stage_cache=StageCache(request.dataset_id, dataset_updated_at, request.cache_salt),
+            max_sub_questions=request.max_sub_questions,
+            enable_python=request.enable_python,
+            enable_world_knowledge=request.enable_world_knowledge,
+            verbose_mode=request.verbose_mode,
+            sub_question_concurrency=request.sub_question_concurrency
         )
+        for i, result in zip(missing, fresh):
+            results[i] = result
+            if isinstance(result, BaseException):
+                logger.error(f"Deep research failed for {request.questions[i]!r}: {result}", exc_info=result)
+            else:
+                await set_cached_research(
+                    request.dataset_id, dataset_updated_at, request.questions[i], result, **cache_params
+                )
+
+    responses = []
+    for question, result in zip(request.questions, results):
+        if not isinstance(result, BaseException):
+            try:
+                responses.append(_analysis_response(result, None))
+                continue
+            except ValidationError as e:
+                result = e
+        responses.append(DeepResearchResponse(
+            success=False,
+            main_question=question,
+            direct_answer="",
+            key_findings=[],
+            supporting_details=[],
+            data_coverage={},
+            follow_up_questions=[],
+            visualizations=[],
+            stages_completed=[],
+            execution_time_seconds=0,
+            error=str(result)
+        ))
+
+    response = Response(content=_research_responses.dump_json(responses), media_type="application/json")
+    if paraphrase_hits:
+        response.headers[_BATCH_PARAPHRASE_HEADER] = ','.join(paraphrase_hits)
+    return response
 
 
 @router.get("/analyze-stream")
 async def deep_research_analyze_stream(
+    http_request: Request,
     dataset_id: str,
     question: str,
-    max_sub_questions: int = 10,
+    max_sub_questions: int = Query(10, ge=1, le=20),
     enable_python: bool = True,
     enable_world_knowledge: bool = True,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    service: DeepResearchService = Depends(get_deep_research_service)
 ):
     """
     Stream deep research progress using Server-Sent Events
     """
 
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(Dataset.id == dataset_id).first()
-    if not dataset:
-        raise HTTPException(status_code=404, detail=f"Dataset {dataset_id} not found")
+    dataset_updated_at = await run_in_threadpool(_get_dataset_version, db, dataset_id)
+
+    stream_key = research_cache_key(
+        dataset_id,
+        dataset_updated_at,
+        question,
+        max_sub_questions=max_sub_questions,
+        enable_python=enable_python,
+        enable_world_knowledge=enable_world_knowledge
+    )
 
     async def event_generator():
-        """Generate SSE events for progress updates"""
-        progress_queue = asyncio.Queue()
-
-        async def progress_callback(stage: int, message: str):
-            """Callback to send progress updates"""
-            await progress_queue.put({
-                'stage': stage,
-                'message': message,
-                'total_stages': 6
-            })
-
-        # Start research in background task
-        async def run_research():
-            try:
-                service = DeepResearchService()
-                result = await service.research(
-                    main_question=question,
-                    dataset_id=dataset_id,
-                    max_sub_questions=max_sub_questions,
-                    enable_python=enable_python,
-                    enable_world_knowledge=enable_world_knowledge,
-                    progress_callback=progress_callback
-                )
-                # Send final result
-                await progress_queue.put({'type': 'complete', 'result': result})
-            except Exception as e:
-                logger.error(f"Deep research error: {str(e)}", exc_info=True)
-                await progress_queue.put({'type': 'error', 'error': str(e)})
-            finally:
-                await progress_queue.put(None)  # Signal completion
-
-        # Start research task
-        research_task = asyncio.create_task(run_research())
-
-        # Stream progress updates
+        """Replay the run's recorded events, then follow it until it finishes"""
+        recorder = _stream_registry.get(stream_key)
+        if recorder is None:
+            recorder = _StreamRecorder()
+            _stream_registry[stream_key] = recorder
+            recorder.task = asyncio.create_task(_record_research(
+                stream_key,
+                recorder,
+                service,
+                main_question=question,
+                dataset_id=dataset_id,
+                max_sub_questions=max_sub_questions,
+                enable_python=enable_python,
+                enable_world_knowledge=enable_world_knowledge,
+                stage_cache=StageCache(dataset_id, dataset_updated_at)
+            ))
+        else:
+            logger.info(f"Attaching to recorded deep research stream for dataset {dataset_id}")
+
+        recorder.subscribers += 1
+        position = 0
+        last_sent = time.monotonic()
         try:
             while True:
-                update = await progress_queue.get()
-                if update is None:
-                    break
-
-                yield f"data: {json.dumps(update)}\n\n"
+                while position < len(recorder.frames):
+                    yield recorder.frames[position]
+                    position += 1
+                    last_sent = time.monotonic()
+
+                if recorder.done:
+                    return
+
+                if not await recorder.wait_for_frames(position, _DISCONNECT_POLL_SECONDS):
+                    if await http_request.is_disconnected():
+                        logger.info(f"Client disconnected from deep research stream for dataset {dataset_id}")
+                        return
+                    if time.monotonic() - last_sent >= _KEEPALIVE_SECONDS:
+                        yield _SSE_KEEPALIVE
+                        last_sent = time.monotonic()
         finally:
-            # Ensure task is cancelled if client disconnects
-            if not research_task.done():
-                research_task.cancel()
+            recorder.subscribers -= 1
+            # Cancel the run once nobody is watching it; a partial run isn't
+            # worth replaying
+            if recorder.subscribers == 0 and not recorder.done:
+                recorder.task.cancel()
+                _evict_stream(stream_key, recorder)
+                # Wait for the run to unwind (its sub-question tasks included)
+                # before the response finishes; shielded because the
+                # disconnect that got us here is itself a cancellation
+                with anyio.CancelScope(shield=True):
+                    await asyncio.gather(recorder.task, return_exceptions=True)
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
+            # Stop nginx-style proxies from buffering the event stream
+            "X-Accel-Buffering": "no",
         }
     )
 
 
 @router.post("/generate-infographic")
-async def generate_infographic(
+def generate_infographic(
     research_result: Dict[str, Any],
     infographic_request: InfographicRequest = InfographicRequest()
 ):
@@ -304,17 +859,15 @@ async def generate_infographic(
     try:
         logger.info(f"Generating {infographic_request.format} infographic with {infographic_request.color_scheme} theme using {infographic_request.generation_method} method")
 
-        # Initialize infographic service
-        infographic_service = InfographicService(template=infographic_request.color_scheme)
-
-        # Generate infographic
-        result = infographic_service.generate_infographic(
-            research_result=research_result,
+        # Generate infographic in the render pool; this thread just waits
+        result = _infographic_job(
+            infographic_request.color_scheme,
+            research_result,
             format=infographic_request.format,
             include_charts=infographic_request.include_charts,
             include_visualizations=infographic_request.include_visualizations,
             generation_method=infographic_request.generation_method
-        )
+        ).result()
 
         logger.info(f"Infographic generated successfully: {result['filename']} ({result['size_bytes']} bytes)")
 
@@ -338,11 +891,62 @@ async def generate_infographic(
         )
 
 
+@router.post("/generate-infographic/raw")
+def generate_infographic_raw(
+    research_result: Dict[str, Any],
+    infographic_request: InfographicRequest = InfographicRequest()
+):
+    """
+    Generate an infographic and return the file itself
+
+    Same input as /generate-infographic, but the response body is the PDF or
+    PNG (with a Content-Disposition filename) instead of base64 inside JSON.
+    """
+
+    try:
+        result = _infographic_job(
+            infographic_request.color_scheme,
+            research_result,
+            format=infographic_request.format,
+            include_charts=infographic_request.include_charts,
+            include_visualizations=infographic_request.include_visualizations,
+            generation_method=infographic_request.generation_method,
+            raw=True
+        ).result()
+    except Exception as e:
+        logger.error(f"Infographic generation failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    logger.info(f"Infographic generated successfully: {result['filename']} ({result['size_bytes']} bytes)")
+
+    return Response(
+        content=result['raw_bytes'],
+        media_type='application/pdf' if result['format'] == 'pdf' else 'image/png',
+        headers={"Content-Disposition": f'attachment; filename="{result["filename"]}"'}
+    )
+
+
+@router.get("/infographic/{job_id}")
+async def get_infographic_job(job_id: str):
+    """
+    Poll an infographic started with infographic_async
+
+    Returns status 'pending' until the render finishes, then 'complete' with
+    the same fields as an inline infographic, or 'failed'. Job state is kept
+    in Redis for 10 minutes, so any worker can answer the poll.
+    """
+    state = await cache_get_json(_infographic_job_key(job_id))
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"Infographic job {job_id} not found")
+    return {'job_id': job_id, **state}
+
+
 @router.post("/analyze-with-infographic", response_model=Dict[str, Any])
 async def analyze_with_infographic(
     request: DeepResearchRequest,
     infographic_request: InfographicRequest = InfographicRequest(),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    service: DeepResearchService = Depends(get_deep_research_service)
 ):
     """
     Convenience endpoint: Run deep research AND generate infographic in one call
@@ -356,25 +960,23 @@ async def analyze_with_infographic(
         # Step 1: Run deep research
         logger.info(f"Running deep research for: {request.question}")
 
-        dataset = db.query(Dataset).filter(Dataset.id == request.dataset_id).first()
-        if not dataset:
-            raise HTTPException(status_code=404, detail=f"Dataset {request.dataset_id} not found")
+        await run_in_threadpool(_get_dataset_version, db, request.dataset_id)
 
-        service = DeepResearchService()
         research_result = await service.research(
             main_question=request.question,
             dataset_id=request.dataset_id,
             max_sub_questions=request.max_sub_questions,
             enable_python=request.enable_python,
-            enable_world_knowledge=request.enable_world_knowledge
+            enable_world_knowledge=request.enable_world_knowledge,
+            sub_question_concurrency=request.sub_question_concurrency
         )
 
         # Step 2: Generate infographic
         logger.info(f"Generating infographic from research results using {infographic_request.generation_method} method")
 
-        infographic_service = InfographicService(template=infographic_request.color_scheme)
-        infographic_result = infographic_service.generate_infographic(
-            research_result=research_result,
+        infographic_result = await _render_infographic(
+            infographic_request.color_scheme,
+            research_result,
             format=infographic_request.format,
             include_charts=infographic_request.include_charts,
             include_visualizations=infographic_request.include_visualizations,
@@ -415,26 +1017,25 @@ async def analyze_with_infographic(
 @router.post("/plan", response_model=PlanResponse)
 async def create_research_plan(
     request: PlanRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    service: DeepResearchService = Depends(get_deep_research_service),
+    x_cache_skip: Optional[str] = Header(default=None)
 ):
     """
     Generate research plan without executing
 
     Returns decomposed sub-questions for user review and editing.
     This allows users to see and modify the research plan before execution.
+    Plans are cached per dataset version and question; send
+    `X-Cache-Skip: 1` to generate a new one.
     """
 
     try:
         # Verify dataset exists
-        dataset = db.query(Dataset).filter(Dataset.id == request.dataset_id).first()
-        if not dataset:
-            raise HTTPException(status_code=404, detail=f"Dataset {request.dataset_id} not found")
+        dataset_updated_at = await run_in_threadpool(_get_dataset_version, db, request.dataset_id)
 
         logger.info(f"Generating research plan for: {request.question}")
 
-        # Initialize service
-        service = DeepResearchService()
-
         # Load schema
         schema = service.storage_service.load_schema(request.dataset_id)
 
@@ -442,33 +1043,37 @@ async def create_research_plan(
         sub_questions = await service._decompose_question(
             request.question,
             schema,
-            request.max_sub_questions
+            request.max_sub_questions,
+            StageCache(request.dataset_id, dataset_updated_at, refresh=x_cache_skip == '1')
         )
 
         logger.info(f"Generated {len(sub_questions)} sub-questions")
 
         # Format response
-        return PlanResponse(
+        # Sub-questions come from LLM JSON, so they are validated even
+        # though the small envelope around them is trusted
+        plan_sub_questions = _plan_sub_questions.validate_python([
+            {
+                "id": f"sq_{i}",
+                "question": sq.question,
+                "intent_type": sq.intent_type,
+                "desired_output": sq.desired_output,
+                "priority": sq.priority,
+                "editable": True
+            }
+            for i, sq in enumerate(sub_questions)
+        ])
+        return _model_response(PlanResponse.model_construct(
             success=True,
             main_question=request.question,
-            sub_questions=[
-                {
-                    "id": f"sq_{i}",
-                    "question": sq.question,
-                    "intent_type": sq.intent_type,
-                    "desired_output": sq.desired_output,
-                    "priority": sq.priority,
-                    "editable": True
-                }
-                for i, sq in enumerate(sub_questions)
-            ],
+            sub_questions=[sq.model_dump() for sq in plan_sub_questions],
             estimated_time=f"{len(sub_questions) * 2}s",
             research_stages=[
                 "Research Websites",
                 "Analyze Results",
                 "Create Report"
             ]
-        )
+        ))
 
     except HTTPException:
         raise
@@ -487,7 +1092,8 @@ async def create_research_plan(
 @router.post("/execute-plan", response_model=DeepResearchResponse)
 async def execute_research_plan(
     request: ExecutePlanRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    service: DeepResearchService = Depends(get_deep_research_service)
 ):
     """
     Execute research with user-edited plan
@@ -498,27 +1104,17 @@ async def execute_research_plan(
 
     try:
         # Verify dataset exists
-        dataset = db.query(Dataset).filter(Dataset.id == request.dataset_id).first()
-        if not dataset:
-            raise HTTPException(status_code=404, detail=f"Dataset {request.dataset_id} not found")
+        dataset_updated_at = await run_in_threadpool(_get_dataset_version, db, request.dataset_id)
 
         logger.info(f"Executing research plan for: {request.main_question}")
 
-        # Initialize service
-        service = DeepResearchService()
-
         # Load schema
         schema = service.storage_service.load_schema(request.dataset_id)
 
         # Convert sub_questions dict back to SubQuestion objects
         from app.services.deep_research_service import SubQuestion
         sub_questions = [
-            SubQuestion(
-                question=sq['question'],
-                intent_type=sq.get('intent_type', 'descriptive'),
-                desired_output=sq.get('desired_output', 'table'),
-                priority=sq.get('priority', 2)
-            )
+            SubQuestion.from_dict(sq)
             for sq in request.sub_questions
         ]
 
@@ -527,21 +1123,31 @@ async def execute_research_plan(
         # Execute research pipeline starting from classification
         # (skip decomposition since we have user-edited sub-questions)
 
-        # Stage 2: Classification & Schema Mapping
-        classified = await service._classify_and_map(sub_questions, schema)
+        stage_cache = StageCache(request.dataset_id, dataset_updated_at)
 
-        # Stage 3: Query Execution
-        results = await service._execute_queries(
-            classified,
-            request.dataset_id,
-            schema,
-            request.enable_python
-        )
+        # Stage 2: Classification & Schema Mapping
+        classified = await service._classify_and_map(sub_questions, schema, stage_cache)
 
-        # Stage 4: World Knowledge Enrichment
-        world_knowledge = {}
+        # Stage 4: World Knowledge Enrichment only needs the classification,
+        # so it runs concurrently with Stage 3: Query Execution
+        world_knowledge_task = None
         if request.enable_world_knowledge:
-            world_knowledge = await service._enrich_world_knowledge(classified, results)
+            world_knowledge_task = asyncio.create_task(
+                service._enrich_world_knowledge(classified, stage_cache=stage_cache)
+            )
+
+        try:
+            results = await service._execute_queries(
+                classified,
+                request.dataset_id,
+                schema,
+                request.enable_python,
+                request.sub_question_concurrency
+            )
+            world_knowledge = await world_knowledge_task if world_knowledge_task else {}
+        finally:
+            if world_knowledge_task and not world_knowledge_task.done():
+                world_knowledge_task.cancel()
 
         # Stage 5: Synthesis & Insight Generation
         synthesis = await service._synthesize_insights(
@@ -554,25 +1160,22 @@ async def execute_research_plan(
         )
 
         # Stage 6: Follow-up Questions
-        follow_ups = await service._suggest_follow_ups(
+        follow_up_questions = await service._suggest_follow_ups(
             request.main_question,
             synthesis,
             schema
         )
 
-        # Extract follow-up questions
-        follow_up_questions = []
-        if isinstance(follow_ups, list):
-            for item in follow_ups:
-                if isinstance(item, dict):
-                    follow_up_questions.append(item.get('question', str(item)))
-                else:
-                    follow_up_questions.append(str(item))
-
-        # Collect visualizations
+        # Collect visualizations, successes and methods in one pass
         visualizations = []
+        questions_answered = 0
+        methods_used = set()
         for r in results:
-            if r.success and r.visualization:
+            methods_used.add(r.method)
+            if not r.success:
+                continue
+            questions_answered += 1
+            if r.visualization:
                 viz_list = r.visualization if isinstance(r.visualization, list) else [r.visualization]
                 for viz in viz_list:
                     visualizations.append({
@@ -585,86 +1188,59 @@ async def execute_research_plan(
 
         # Build data coverage
         data_coverage = {
-            'questions_answered': sum(1 for r in results if r.success),
+            'questions_answered': questions_answered,
             'total_questions': len(sub_questions),
             'gaps': synthesis.get('gaps', []),
-            'methods_used': list(set(r.method for r in results))
+            'methods_used': list(methods_used)
         }
 
+        stages_completed = (
+            _PLAN_STAGES_WITH_KNOWLEDGE if request.enable_world_knowledge
+            else _PLAN_STAGES_WITHOUT_KNOWLEDGE
+        )
+
         # Generate infographic if requested
         infographic_data = None
         if request.generate_infographic:
-            try:
-                logger.info("Auto-generating infographic...")
-                infographic_service = InfographicService(template=request.infographic_color_scheme)
-
-                result_for_infographic = {
-                    'research_id': f"plan_exec_{int(datetime.utcnow().timestamp())}",
-                    'main_question': request.main_question,
-                    'sub_questions_count': len(sub_questions),
-                    'direct_answer': synthesis.get('direct_answer', ''),
-                    'key_findings': synthesis.get('key_findings', []),
-                    'supporting_details': synthesis.get('supporting_details', {}),
-                    'data_coverage': data_coverage,
-                    'follow_up_questions': follow_up_questions,
-                    'visualizations': visualizations,
-                    'stages_completed': [
-                        'Question decomposition (user-edited)',
-                        'Schema mapping',
-                        'Query execution',
-                        'Knowledge enrichment' if request.enable_world_knowledge else 'Knowledge enrichment (skipped)',
-                        'Insight synthesis',
-                        'Follow-up generation'
-                    ],
-                    'execution_time_seconds': 0
-                }
-
-                infographic_result = infographic_service.generate_infographic(
-                    research_result=result_for_infographic,
-                    format=request.infographic_format,
-                    include_charts=True,
-                    include_visualizations=True,
-                    generation_method=request.infographic_generation_method
-                )
-                infographic_data = {
-                    'data': infographic_result['data'],
-                    'format': infographic_result['format'],
-                    'filename': infographic_result['filename'],
-                    'size_bytes': infographic_result['size_bytes']
-                }
-                logger.info(f"Infographic generated: {infographic_result['filename']}")
-            except Exception as e:
-                logger.error(f"Infographic generation failed: {str(e)}", exc_info=True)
+            result_for_infographic = {
+                'research_id': f"plan_exec_{time.time_ns() // 1_000_000_000}",
+                'main_question': request.main_question,
+                'sub_questions_count': len(sub_questions),
+                'direct_answer': synthesis.get('direct_answer', ''),
+                'key_findings': synthesis.get('key_findings', []),
+                'supporting_details': synthesis.get('supporting_details', []),
+                'data_coverage': data_coverage,
+                'follow_up_questions': follow_up_questions,
+                'visualizations': visualizations,
+                'stages_completed': stages_completed,
+                'execution_time_seconds': 0
+            }
+            infographic_data = await _requested_infographic(request, result_for_infographic)
 
         logger.info(f"Plan execution complete")
 
         # Return response
-        return DeepResearchResponse(
+        return _model_response(DeepResearchResponse.model_construct(
             success=True,
             main_question=request.main_question,
-            direct_answer=synthesis.get('direct_answer', 'Analysis complete'),
-            key_findings=synthesis.get('key_findings', []),
-            supporting_details=synthesis.get('supporting_details', []),
-            data_coverage=data_coverage,
-            follow_up_questions=follow_up_questions,
+            **_validated_llm_fields(
+                direct_answer=synthesis.get('direct_answer', 'Analysis complete'),
+                key_findings=synthesis.get('key_findings', []),
+                supporting_details=synthesis.get('supporting_details', []),
+                data_coverage=data_coverage,
+                follow_up_questions=follow_up_questions
+            ),
             visualizations=visualizations,
-            stages_completed=[
-                'Question decomposition (user-edited)',
-                'Schema mapping',
-                'Query execution',
-                'Knowledge enrichment' if request.enable_world_knowledge else 'Knowledge enrichment (skipped)',
-                'Insight synthesis',
-                'Follow-up generation'
-            ],
+            stages_completed=stages_completed,
             execution_time_seconds=0,
             infographic=infographic_data
-        )
+        ))
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Plan execution failed: {str(e)}", exc_info=True)
-        return DeepResearchResponse(
+        return _model_response(DeepResearchResponse(
             success=False,
             main_question=request.main_question,
             direct_answer="",
@@ -676,7 +1252,7 @@ async def execute_research_plan(
             stages_completed=[],
             execution_time_seconds=0,
             error=str(e)
-        )
+        ))
 
 
 @router.get("/health")
@@ -1,13 +1,15 @@
 from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy import update as sa_update, not_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 from app.core.database import get_db
-from app.models.dataset import Dataset
 from app.models.column_metadata import ColumnMetadata, QueryRule
 from app.services.ai_metadata_service import AIMetadataService
+from app.core.dataset_exists import dataset_exists
 
 router = APIRouter(prefix="/metadata", tags=["metadata"])
 
@@ -76,18 +78,13 @@ class QueryRuleResponse(BaseModel):
 # Column Metadata Endpoints
 
 @router.get("/datasets/{dataset_id}/columns", response_model=List[ColumnMetadataResponse])
-async def get_column_metadata(
+def get_column_metadata(
     dataset_id: str,
     db: Session = Depends(get_db)
 ):
     """Get metadata for all columns in a dataset"""
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, dataset_id):
         raise HTTPException(404, "Dataset not found")
 
     metadata = db.query(ColumnMetadata).filter(
@@ -98,7 +95,7 @@ async def get_column_metadata(
 
 
 @router.put("/datasets/{dataset_id}/columns/{column_name}")
-async def update_column_metadata(
+def update_column_metadata(
     dataset_id: str,
     column_name: str,
     update: ColumnMetadataUpdate,
@@ -106,41 +103,38 @@ async def update_column_metadata(
 ):
     """Update or create metadata for a column"""
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, dataset_id):
         raise HTTPException(404, "Dataset not found")
 
-    # Get or create metadata
-    metadata = db.query(ColumnMetadata).filter(
-        ColumnMetadata.dataset_id == dataset_id,
-        ColumnMetadata.column_name == column_name
-    ).first()
+    # Update fields (column_name comes from the path and is the key)
+    fields = update.dict(exclude_unset=True)
+    fields.pop('column_name', None)
+    fields['updated_at'] = datetime.utcnow()
 
-    if not metadata:
-        metadata = ColumnMetadata(
-            dataset_id=dataset_id,
-            column_name=column_name
-        )
-        db.add(metadata)
-
-    # Update fields
-    for field, value in update.dict(exclude_unset=True).items():
-        if field != 'column_name':  # Don't update the key
-            setattr(metadata, field, value)
-
-    metadata.updated_at = datetime.utcnow()
+    # Single-statement upsert; the unique (dataset_id, column_name) index
+    # makes concurrent first writes for the same column safe
+    stmt = insert(ColumnMetadata).values(
+        dataset_id=dataset_id,
+        column_name=column_name,
+        **fields
+    ).on_conflict_do_update(
+        index_elements=[ColumnMetadata.dataset_id, ColumnMetadata.column_name],
+        set_=fields
+    ).returning(ColumnMetadata)
+
+    metadata = db.scalars(
+        stmt,
+        execution_options={"populate_existing": True}
+    ).one()
+    # Detach so commit doesn't expire the RETURNING values and force a reload
+    db.expunge(metadata)
     db.commit()
-    db.refresh(metadata)
 
     return metadata
 
 
 @router.delete("/datasets/{dataset_id}/columns/{column_name}")
-async def delete_column_metadata(
+def delete_column_metadata(
     dataset_id: str,
     column_name: str,
     db: Session = Depends(get_db)
@@ -163,19 +157,14 @@ async def delete_column_metadata(
 # Query Rules Endpoints
 
 @router.get("/datasets/{dataset_id}/rules", response_model=List[QueryRuleResponse])
-async def get_query_rules(
+def get_query_rules(
     dataset_id: str,
     active_only: bool = False,
     db: Session = Depends(get_db)
 ):
     """Get all query rules for a dataset"""
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, dataset_id):
         raise HTTPException(404, "Dataset not found")
 
     query = db.query(QueryRule).filter(QueryRule.dataset_id == dataset_id)
@@ -189,19 +178,14 @@ async def get_query_rules(
 
 
 @router.post("/datasets/{dataset_id}/rules", response_model=QueryRuleResponse)
-async def create_query_rule(
+def create_query_rule(
     dataset_id: str,
     rule: QueryRuleCreate,
     db: Session = Depends(get_db)
 ):
     """Create a new query rule"""
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, dataset_id):
         raise HTTPException(404, "Dataset not found")
 
     # Create rule
@@ -218,34 +202,36 @@ async def create_query_rule(
 
 
 @router.put("/datasets/{dataset_id}/rules/{rule_id}", response_model=QueryRuleResponse)
-async def update_query_rule(
+def update_query_rule(
     dataset_id: str,
     rule_id: str,
     rule: QueryRuleCreate,
     db: Session = Depends(get_db)
 ):
     """Update a query rule"""
-    existing_rule = db.query(QueryRule).filter(
-        QueryRule.id == rule_id,
-        QueryRule.dataset_id == dataset_id
-    ).first()
+    # Single UPDATE ... RETURNING instead of select, update and refresh
+    existing_rule = db.scalars(
+        sa_update(QueryRule).where(
+            QueryRule.id == rule_id,
+            QueryRule.dataset_id == dataset_id
+        ).values(
+            **rule.dict(),
+            updated_at=datetime.utcnow()
+        ).returning(QueryRule)
+    ).one_or_none()
 
     if not existing_rule:
         raise HTTPException(404, "Rule not found")
 
-    # Update fields
-    for field, value in rule.dict().items():
-        setattr(existing_rule, field, value)
-
-    existing_rule.updated_at = datetime.utcnow()
+    # Detach so commit doesn't expire the RETURNING values and force a reload
+    db.expunge(existing_rule)
     db.commit()
-    db.refresh(existing_rule)
 
     return existing_rule
 
 
 @router.delete("/datasets/{dataset_id}/rules/{rule_id}")
-async def delete_query_rule(
+def delete_query_rule(
     dataset_id: str,
     rule_id: str,
     db: Session = Depends(get_db)
@@ -266,24 +252,27 @@ async def delete_query_rule(
 
 
 @router.post("/datasets/{dataset_id}/rules/{rule_id}/toggle")
-async def toggle_query_rule(
+def toggle_query_rule(
     dataset_id: str,
     rule_id: str,
     db: Session = Depends(get_db)
 ):
     """Toggle a rule's active status"""
-    rule = db.query(QueryRule).filter(
-        QueryRule.id == rule_id,
-        QueryRule.dataset_id == dataset_id
-    ).first()
+    rule = db.scalars(
+        sa_update(QueryRule).where(
+            QueryRule.id == rule_id,
+            QueryRule.dataset_id == dataset_id
+        ).values(
+            is_active=not_(QueryRule.is_active),
+            updated_at=datetime.utcnow()
+        ).returning(QueryRule)
+    ).one_or_none()
 
     if not rule:
         raise HTTPException(404, "Rule not found")
 
-    rule.is_active = not rule.is_active
-    rule.updated_at = datetime.utcnow()
+    db.expunge(rule)
     db.commit()
-    db.refresh(rule)
 
     return rule
 
@@ -318,12 +307,7 @@ async def ai_update_metadata(
     - "Add business definitions for customer columns"
     """
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, dataset_id):
         raise HTTPException(404, "Dataset not found")
 
     try:
@@ -362,12 +346,7 @@ async def ai_create_rules(
     - "Only show data from 2024"
     """
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, dataset_id):
         raise HTTPException(404, "Dataset not found")
 
     try:
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
@@ -6,14 +7,14 @@ import uuid
 import time
 from datetime import datetime
 
-from app.core.database import get_db
-from app.models.dataset import Dataset
+from app.core.database import get_db, SessionLocal
 from app.models.code_execution import CodeExecution, MLModel, ExecutionMode, ExecutionStatus
 from app.services.nl_to_python_service import NLToPythonService
 from app.services.code_executor_service import CodeExecutorService
 from app.services.ml_model_service import MLModelService
 from app.services.workflow_orchestrator import WorkflowOrchestrator
 from app.services.code_fixer_service import CodeFixerService
+from app.core.dataset_exists import dataset_exists
 
 router = APIRouter(prefix="/python-analysis", tags=["python-analysis"])
 
@@ -62,12 +63,7 @@ async def generate_python_code(
     """Generate Python code from natural language query"""
 
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == request.dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, request.dataset_id):
         raise HTTPException(404, "Dataset not found")
 
     # Generate Python code
@@ -97,14 +93,22 @@ async def generate_python_code(
         code_metadata=result
     )
     db.add(code_execution)
+
+    execute_now = request.execute_immediately and safety_check['is_safe']
+    if execute_now:
+        code_execution.execution_status = ExecutionStatus.RUNNING
+
+    # Committed before executing so GET /execution/{id} sees the run and the
+    # pooled connection isn't held open for the length of the execution
     db.commit()
 
     # Auto-execute if requested and safe
-    if request.execute_immediately and safety_check['is_safe']:
+    if execute_now:
         # Execute in background (in production, use Celery task)
         try:
             executor = CodeExecutorService()
-            exec_result = executor.execute_python(
+            exec_result = await run_in_threadpool(
+                executor.execute_python,
                 code=result['code'],
                 dataset_id=request.dataset_id
             )
@@ -115,12 +119,12 @@ async def generate_python_code(
             code_execution.visualizations = exec_result.get('visualizations')
             code_execution.error_message = exec_result.get('error')
             code_execution.completed_at = datetime.utcnow()
-            db.commit()
 
         except Exception as e:
             code_execution.execution_status = ExecutionStatus.FAILED
             code_execution.error_message = str(e)
-            db.commit()
+
+        db.commit()
 
     return {
         'execution_id': execution_id,
@@ -168,7 +172,8 @@ async def execute_python_code(
         start_time = time.time()
 
         for attempt in range(max_retries + 1):
-            exec_result = executor.execute_python(
+            exec_result = await run_in_threadpool(
+                executor.execute_python,
                 code=current_code,
                 dataset_id=code_execution.dataset_id
             )
@@ -257,7 +262,7 @@ async def execute_python_code(
 
 
 @router.get("/execution/{execution_id}", response_model=ExecutionResultResponse)
-async def get_execution_result(
+def get_execution_result(
     execution_id: str,
     db: Session = Depends(get_db)
 ):
@@ -280,20 +285,47 @@ async def get_execution_result(
     }
 
 
+def _save_workflow_executions(
+    dataset_id: str,
+    nl_input: str,
+    workflow_id: str,
+    steps: List[Dict[str, Any]]
+):
+    """Persist workflow step records (runs as a background task)"""
+    # The request session is closed by the time background tasks run
+    db = SessionLocal()
+    try:
+        completed_at = datetime.utcnow()
+        for step_result in steps:
+            db.add(CodeExecution(
+                id=str(uuid.uuid4()),
+                dataset_id=dataset_id,
+                nl_input=nl_input,
+                mode=ExecutionMode.WORKFLOW,
+                generated_code=step_result.get('code', ''),
+                execution_status=ExecutionStatus(step_result['status'].upper()),
+                execution_time_ms=step_result['execution_time_ms'],
+                result_summary=step_result.get('result'),
+                error_message=step_result.get('error'),
+                workflow_id=workflow_id,
+                step_number=step_result['step'],
+                completed_at=completed_at
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
 @router.post("/workflow", response_model=Dict[str, Any])
 async def execute_workflow(
     request: WorkflowExecutionRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Execute multi-step workflow"""
 
     # Verify dataset
-    dataset = db.query(Dataset).filter(
-        Dataset.id == request.dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, request.dataset_id):
         raise HTTPException(404, "Dataset not found")
 
     # Generate workflow steps
@@ -317,28 +349,14 @@ async def execute_workflow(
             dataset_id=request.dataset_id
         )
 
-        # Save workflow execution records
-        workflow_id = workflow_result['workflow_id']
-
-        for step_result in workflow_result['steps']:
-            execution_id = str(uuid.uuid4())
-            code_execution = CodeExecution(
-                id=execution_id,
-                dataset_id=request.dataset_id,
-                nl_input=request.query,
-                mode=ExecutionMode.WORKFLOW,
-                generated_code=step_result.get('code', ''),
-                execution_status=ExecutionStatus(step_result['status'].upper()),
-                execution_time_ms=step_result['execution_time_ms'],
-                result_summary=step_result.get('result'),
-                error_message=step_result.get('error'),
-                workflow_id=workflow_id,
-                step_number=step_result['step'],
-                completed_at=datetime.utcnow()
-            )
-            db.add(code_execution)
-
-        db.commit()
+        # Save workflow execution records after the response is sent
+        background_tasks.add_task(
+            _save_workflow_executions,
+            request.dataset_id,
+            request.query,
+            workflow_result['workflow_id'],
+            workflow_result['steps']
+        )
 
         return workflow_result
 
@@ -347,7 +365,7 @@ async def execute_workflow(
 
 
 @router.get("/executions/dataset/{dataset_id}")
-async def list_dataset_executions(
+def list_dataset_executions(
     dataset_id: str,
     limit: int = 50,
     db: Session = Depends(get_db)
@@ -375,7 +393,7 @@ async def list_dataset_executions(
 
 
 @router.get("/models/dataset/{dataset_id}")
-async def list_dataset_models(
+def list_dataset_models(
     dataset_id: str,
     db: Session = Depends(get_db)
 ):
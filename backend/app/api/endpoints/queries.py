@@ -1,32 +1,63 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
+import pandas as pd
+import orjson
 import uuid
 import time
 
 from app.core.database import get_db
-from app.models.dataset import Dataset
 from app.models.query import Query, QueryStatus
 from app.schemas.query import NLQueryRequest, SQLQueryRequest, QueryResponse
 from app.services.nl_to_sql_service import NLToSQLService
 from app.services.duckdb_service import DuckDBService
 from app.services.storage_service import StorageService
+from app.api.deps import get_duckdb_service, get_storage_service
+from app.core.dataset_exists import dataset_exists
 
 router = APIRouter(prefix="/queries", tags=["queries"])
 
 
+def _unique_columns(columns) -> list:
+    """Column names with duplicates (common after SQL joins) suffixed _1, _2, ..."""
+    seen = set()
+    unique = []
+    for name in map(str, columns):
+        candidate, n = name, 0
+        while candidate in seen:
+            n += 1
+            candidate = f"{name}_{n}"
+        seen.add(candidate)
+        unique.append(candidate)
+    return unique
+
+
+def _rows_response(payload: dict, df: pd.DataFrame) -> Response:
+    """Build a QueryResponse body with rows serialized by pandas' C JSON writer
+
+    Avoids materializing a list of per-row dicts just to re-encode them,
+    and writes NaN/inf as null instead of failing JSON encoding. The rows
+    are embedded into the orjson-encoded envelope as a pre-encoded fragment.
+    """
+    if not df.columns.is_unique:
+        # to_json refuses duplicate column names with orient='records'
+        df = df.set_axis(_unique_columns(df.columns), axis=1)
+    rows_json = df.to_json(orient='records', date_format='iso', default_handler=str)
+    content = orjson.dumps({**payload, "rows": orjson.Fragment(rows_json)})
+    return Response(content=content, media_type="application/json")
+
+
 @router.post("/nl", response_model=QueryResponse)
 async def execute_nl_query(
     request: NLQueryRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    duckdb_service: DuckDBService = Depends(get_duckdb_service),
+    storage: StorageService = Depends(get_storage_service)
 ):
     """Natural language to SQL query"""
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == request.dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, request.dataset_id):
         raise HTTPException(404, "Dataset not found")
 
     # Generate SQL
@@ -36,47 +67,36 @@ async def execute_nl_query(
     except Exception as e:
         raise HTTPException(500, f"Failed to generate SQL: {str(e)}")
 
+    sql = result['sql']
+
     # Execute SQL
-    duckdb_service = DuckDBService()
     query_id = str(uuid.uuid4())
 
+    # Only query execution failures are reported as a failed query;
+    # errors saving the record below surface as-is
     try:
         start_time = time.time()
-        df = duckdb_service.execute_query(result['sql'], request.dataset_id)
+        df = await run_in_threadpool(duckdb_service.execute_query, sql, request.dataset_id)
         execution_time_ms = int((time.time() - start_time) * 1000)
+        total_rows = len(df)
 
         # Save query result
-        storage = StorageService()
-        result_path = storage.save_query_result(df, query_id)
-
-        # Save query record
-        query = Query(
-            id=query_id,
-            dataset_id=request.dataset_id,
-            nl_input=request.query,
-            generated_sql=result['sql'],
-            execution_time_ms=execution_time_ms,
-            result_rows=len(df),
-            result_path=result_path,
-            status=QueryStatus.SUCCESS,
-            query_metadata=result
-        )
-        db.add(query)
-        db.commit()
+        result_path = await run_in_threadpool(storage.save_query_result, df, query_id)
 
-        return {
+        # Encoded before the record is saved so an unencodable result is
+        # recorded as a failed query rather than a successful one
+        response = _rows_response({
             "query_id": query_id,
-            "sql": result['sql'],
-            "rows": df.head(1000).to_dict('records'),  # Return first 1000
-            "total_rows": len(df),
+            "sql": sql,
+            "total_rows": total_rows,
             "execution_time_ms": execution_time_ms,
             "retrieved_columns": result.get('retrieved_columns'),
             "status": "SUCCESS"
-        }
+        }, df.head(1000))  # Return first 1000
 
     except Exception as e:
         # Save failed query
-        error_sql = result.get('sql', '') if 'result' in locals() else ''
+        error_sql = sql
         query = Query(
             id=query_id,
             dataset_id=request.dataset_id,
@@ -97,58 +117,56 @@ async def execute_nl_query(
         error_msg = f"Query execution failed: {str(e)}"
         if error_sql:
             error_msg += f"\n\nGenerated SQL:\n{error_sql}"
-        raise HTTPException(400, error_msg)
+        raise HTTPException(400, error_msg) from None
+
+    # Save query record
+    query = Query(
+        id=query_id,
+        dataset_id=request.dataset_id,
+        nl_input=request.query,
+        generated_sql=sql,
+        execution_time_ms=execution_time_ms,
+        result_rows=total_rows,
+        result_path=result_path,
+        status=QueryStatus.SUCCESS,
+        query_metadata=result
+    )
+    db.add(query)
+    db.commit()
+
+    return response
 
 
 @router.post("/sql", response_model=QueryResponse)
 async def execute_sql_query(
     request: SQLQueryRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    duckdb_service: DuckDBService = Depends(get_duckdb_service),
+    storage: StorageService = Depends(get_storage_service)
 ):
     """Direct SQL execution"""
     # Verify dataset exists
-    dataset = db.query(Dataset).filter(
-        Dataset.id == request.dataset_id,
-        Dataset.deleted_at.is_(None)
-    ).first()
-
-    if not dataset:
+    if not dataset_exists(db, request.dataset_id):
         raise HTTPException(404, "Dataset not found")
 
-    duckdb_service = DuckDBService()
     query_id = str(uuid.uuid4())
 
     try:
         start_time = time.time()
-        df = duckdb_service.execute_query(request.sql, request.dataset_id)
+        df = await run_in_threadpool(duckdb_service.execute_query, request.sql, request.dataset_id)
         execution_time_ms = int((time.time() - start_time) * 1000)
+        total_rows = len(df)
 
         # Save query result
-        storage = StorageService()
-        result_path = storage.save_query_result(df, query_id)
-
-        # Save query
-        query = Query(
-            id=query_id,
-            dataset_id=request.dataset_id,
-            nl_input=None,
-            generated_sql=request.sql,
-            execution_time_ms=execution_time_ms,
-            result_rows=len(df),
-            result_path=result_path,
-            status=QueryStatus.SUCCESS
-        )
-        db.add(query)
-        db.commit()
+        result_path = await run_in_threadpool(storage.save_query_result, df, query_id)
 
-        return {
+        response = _rows_response({
             "query_id": query_id,
             "sql": request.sql,
-            "rows": df.head(1000).to_dict('records'),
-            "total_rows": len(df),
+            "total_rows": total_rows,
             "execution_time_ms": execution_time_ms,
             "status": "SUCCESS"
-        }
+        }, df.head(1000))
 
     except Exception as e:
         # Save failed query
@@ -163,11 +181,31 @@ async def execute_sql_query(
         db.add(query)
         db.commit()
 
-        raise HTTPException(400, f"Query execution failed: {str(e)}")
+        raise HTTPException(400, f"Query execution failed: {str(e)}") from None
+
+    # Save query
+    query = Query(
+        id=query_id,
+        dataset_id=request.dataset_id,
+        nl_input=None,
+        generated_sql=request.sql,
+        execution_time_ms=execution_time_ms,
+        result_rows=total_rows,
+        result_path=result_path,
+        status=QueryStatus.SUCCESS
+    )
+    db.add(query)
+    db.commit()
+
+    return response
 
 
 @router.get("/{query_id}", response_model=QueryResponse)
-async def get_query(query_id: str, db: Session = Depends(get_db)):
+def get_query(
+    query_id: str,
+    db: Session = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service)
+):
     """Get query result"""
     query = db.query(Query).filter(Query.id == query_id).first()
 
@@ -185,16 +223,14 @@ async def get_query(query_id: str, db: Session = Depends(get_db)):
         }
 
     # Load result from Parquet
-    storage = StorageService()
     try:
         df = storage.load_query_result(query_id)
-        return {
+        return _rows_response({
             "query_id": query.id,
             "sql": query.generated_sql,
-            "rows": df.to_dict('records'),
             "total_rows": len(df),
             "execution_time_ms": query.execution_time_ms,
             "status": query.status.value
-        }
+        }, df)
     except Exception as e:
         raise HTTPException(500, f"Failed to load query result: {str(e)}")
@@ -13,14 +13,17 @@ from app.schemas.visualization import (
 )
 from app.services.visualization_service import VizService
 from app.services.storage_service import StorageService
+from app.api.deps import get_storage_service, get_viz_service
 
 router = APIRouter(prefix="/visualizations", tags=["visualizations"])
 
 
 @router.post("/suggest", response_model=VizSuggestionsResponse)
-async def suggest_visualizations(
+def suggest_visualizations(
     request: VizSuggestionRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+    viz_service: VizService = Depends(get_viz_service)
 ):
     """Suggest chart types for query result"""
     query = db.query(Query).filter(Query.id == request.query_id).first()
@@ -32,21 +35,19 @@ async def suggest_visualizations(
         raise HTTPException(400, "Query did not execute successfully")
 
     # Load query result
-    storage = StorageService()
     try:
         df = storage.load_query_result(request.query_id)
     except Exception as e:
         raise HTTPException(500, f"Failed to load query result: {str(e)}")
 
     # Generate suggestions
-    viz_service = VizService()
     suggestions = viz_service.suggest_charts(df, query.nl_input)
 
     return {"suggestions": suggestions}
 
 
 @router.post("/", response_model=VizResponse)
-async def create_visualization(
+def create_visualization(
     request: CreateVizRequest,
     db: Session = Depends(get_db)
 ):
@@ -74,7 +75,7 @@ async def create_visualization(
 
 
 @router.get("/{viz_id}", response_model=VizResponse)
-async def get_visualization(viz_id: str, db: Session = Depends(get_db)):
+def get_visualization(viz_id: str, db: Session = Depends(get_db)):
     """Get visualization spec"""
     viz = db.query(Visualization).filter(Visualization.id == viz_id).first()
 
@@ -85,7 +86,7 @@ async def get_visualization(viz_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/query/{query_id}", response_model=list[VizResponse])
-async def list_query_visualizations(query_id: str, db: Session = Depends(get_db)):
+def list_query_visualizations(query_id: str, db: Session = Depends(get_db)):
     """List all visualizations for a query"""
     visualizations = db.query(Visualization).filter(
         Visualization.query_id == query_id
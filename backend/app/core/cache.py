@@ -0,0 +1,54 @@
+from typing import Any, Optional
+
+import orjson
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+# Lazily created so importing this module never opens a connection
+_client: Optional[redis.Redis] = None
+
+DEFAULT_TTL_SECONDS = 86400
+
+
+def get_redis() -> redis.Redis:
+    """Return the shared async Redis client"""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+async def cache_get_json(key: str) -> Optional[Any]:
+    """Read a JSON value from Redis, treating any Redis failure as a miss"""
+    try:
+        cached = await get_redis().get(key)
+    except redis.RedisError as e:
+        print(f"Cache read failed for {key}: {e}")
+        return None
+    return orjson.loads(cached) if cached is not None else None
+
+
+async def cache_set_json(key: str, value: Any, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+    """Write a JSON value to Redis; failures are logged and ignored
+
+    Encoded once with orjson; numpy values are written natively and the
+    bytes go to Redis as-is.
+    """
+    payload = orjson.dumps(
+        value,
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+    try:
+        await get_redis().set(key, payload, ex=ttl)
+    except redis.RedisError as e:
+        print(f"Cache write failed for {key}: {e}")
+
+
+async def close_redis() -> None:
+    """Close the shared client on application shutdown"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -20,6 +20,12 @@ class Settings(BaseSettings):
     QUERY_TIMEOUT_SECONDS: int = 30
     MAX_QUERY_ROWS: int = 100000
 
+    # Database connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT_SECONDS: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+
     # Python execution settings
     PYTHON_EXECUTION_TIMEOUT_SECONDS: int = 120
     PYTHON_MAX_MEMORY_MB: int = 1024
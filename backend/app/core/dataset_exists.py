@@ -0,0 +1,47 @@
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.dataset import Dataset
+
+# Ids recently found missing or deleted: id -> expiry on time.monotonic().
+# Only absences are remembered: dataset ids are generated server-side and a
+# deleted dataset is never restored, so a miss stays true in every worker,
+# while a found version can change (edit, delete) at any time.
+_missing: Dict[str, float] = {}
+_MISSING_TTL_SECONDS = 60
+_CACHE_SIZE = 4096
+
+
+def dataset_version(db: Session, dataset_id: str) -> Optional[datetime]:
+    """Return a non-deleted dataset's updated_at, or None if there is none
+
+    Selects the single column instead of loading the whole row. A found
+    version is always read fresh, since research cache keys are built from
+    it; only misses are answered from memory.
+    """
+    expiry = _missing.get(dataset_id)
+    if expiry is not None and expiry > time.monotonic():
+        return None
+
+    row = db.execute(
+        select(Dataset.updated_at).where(
+            Dataset.id == dataset_id,
+            Dataset.deleted_at.is_(None)
+        )
+    ).first()
+    if row is not None:
+        return row[0]
+
+    if len(_missing) >= _CACHE_SIZE:
+        _missing.clear()
+    _missing[dataset_id] = time.monotonic() + _MISSING_TTL_SECONDS
+    return None
+
+
+def dataset_exists(db: Session, dataset_id: str) -> bool:
+    """Check for a non-deleted dataset, answering repeated misses from memory"""
+    return dataset_version(db, dataset_id) is not None
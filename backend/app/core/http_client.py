@@ -0,0 +1,31 @@
+from typing import Optional
+
+import httpx
+
+# Lazily created so importing this module never opens a connection
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client
+
+    Reusing one pooled client keeps TLS connections to the LLM provider alive
+    across calls instead of handshaking for every request, and HTTP/2 lets
+    concurrent calls share a connection.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200)
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client on application shutdown"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
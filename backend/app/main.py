@@ -1,7 +1,10 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import api_router
 from app.core.config import settings
+from app.core.cache import close_redis
+from app.core.http_client import close_http_client
 
 # Import models to ensure they're registered with SQLAlchemy
 from app.models import (
@@ -19,7 +22,9 @@ from app.models.column_metadata import ColumnMetadata, QueryRule
 app = FastAPI(
     title="AI Analytics Platform",
     description="AI-assisted analytics for spreadsheets",
-    version="1.0.0"
+    version="1.0.0",
+    # Encode JSON responses with orjson; routers can still override this
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -29,12 +34,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets browser clients see research cache paraphrase flags
+    expose_headers=["X-Research-Cache", "X-Research-Paraphrase-Hits"],
 )
 
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Release shared clients"""
+    await close_redis()
+    await close_http_client()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, JSON, Integer
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, JSON, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -8,6 +8,9 @@ from app.core.database import Base
 class ColumnMetadata(Base):
     """Extended metadata for dataset columns"""
     __tablename__ = "column_metadata"
+    __table_args__ = (
+        UniqueConstraint("dataset_id", "column_name", name="uq_column_metadata_dataset_column"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     dataset_id = Column(String, ForeignKey("datasets.id"), nullable=False)
@@ -1,9 +1,9 @@
 """AI-powered metadata and query rule generation"""
 import json
-import httpx
 from typing import Dict, Any, List
 from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.models.column_metadata import ColumnMetadata, QueryRule
 from app.services.storage_service import StorageService
 
@@ -230,32 +230,32 @@ JSON output:"""
         """Call OpenRouter API"""
         print(f"🤖 Calling AI for metadata/rules generation with model: {settings.OPENROUTER_MODEL}")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": settings.OPENROUTER_MODEL,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.1
-                }
-            )
+        response = await get_http_client().post(
+            "https://openrouter.ai/api/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": settings.OPENROUTER_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.1
+            },
+            timeout=30.0
+        )
 
-            if response.status_code != 200:
-                raise Exception(f"AI API error (status {response.status_code}): {response.text}")
+        if response.status_code != 200:
+            raise Exception(f"AI API error (status {response.status_code}): {response.text}")
 
-            result = response.json()
+        result = response.json()
 
-            if 'error' in result:
-                raise Exception(f"AI API error: {result['error']}")
+        if 'error' in result:
+            raise Exception(f"AI API error: {result['error']}")
 
-            if 'choices' not in result or len(result['choices']) == 0:
-                raise Exception(f"Unexpected API response: {json.dumps(result)}")
+        if 'choices' not in result or len(result['choices']) == 0:
+            raise Exception(f"Unexpected API response: {json.dumps(result)}")
 
-            return result['choices'][0]['message']['content']
+        return result['choices'][0]['message']['content']
 
     def _parse_metadata_response(self, response: str) -> Dict[str, Any]:
         """Parse AI response to extract metadata updates"""
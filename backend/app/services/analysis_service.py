@@ -8,17 +8,33 @@ class AnalysisService:
 
     def generate_dataset_description(self, df: pd.DataFrame, schema: dict) -> Dict[str, Any]:
         """Generate comprehensive dataset description"""
+        stats = self._compute_frame_stats(df)
 
         description = {
             "overview": self._generate_overview(df, schema),
-            "columns_analysis": self._analyze_columns(df, schema),
-            "data_quality": self._assess_data_quality(df),
-            "key_insights": self._generate_insights(df, schema),
-            "suggestions": self._generate_suggestions(df, schema)
+            "columns_analysis": self._analyze_columns(df, schema, stats),
+            "data_quality": self._assess_data_quality(df, stats),
+            "key_insights": self._generate_insights(df, schema, stats),
+            "suggestions": self._generate_suggestions(df, schema, stats)
         }
 
         return description
 
+    def _compute_frame_stats(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Compute the full-frame scans shared by every section in one pass each"""
+        null_counts = df.isnull().sum()
+        duplicated = df.duplicated()
+
+        return {
+            "null_counts": null_counts,
+            "null_pct": null_counts / len(df) * 100,
+            "nunique": df.nunique(),
+            "missing_cells": int(null_counts.sum()),
+            "duplicate_rows": int(duplicated.sum()),
+            "duplicate_rows_pct": duplicated.mean() * 100,
+            "columns_with_missing": null_counts.index[null_counts > 0].tolist()
+        }
+
     def _generate_overview(self, df: pd.DataFrame, schema: dict) -> Dict[str, Any]:
         """Generate high-level overview"""
         return {
@@ -30,20 +46,21 @@ class AnalysisService:
             "memory_usage_mb": round(df.memory_usage(deep=True).sum() / 1024 / 1024, 2)
         }
 
-    def _analyze_columns(self, df: pd.DataFrame, schema: dict) -> List[Dict[str, Any]]:
+    def _analyze_columns(self, df: pd.DataFrame, schema: dict, stats: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Analyze each column"""
         columns_info = []
 
         for col in df.columns:
             col_data = df[col]
+            unique_count = int(stats["nunique"][col])
             col_info = {
                 "name": col,
                 "type": str(col_data.dtype),
-                "missing_count": int(col_data.isnull().sum()),
-                "missing_pct": round(col_data.isnull().mean() * 100, 2),
-                "unique_count": int(col_data.nunique()),
-                "cardinality": "high" if col_data.nunique() > len(df) * 0.9 else
-                              ("medium" if col_data.nunique() > 10 else "low")
+                "missing_count": int(stats["null_counts"][col]),
+                "missing_pct": round(stats["null_pct"][col], 2),
+                "unique_count": unique_count,
+                "cardinality": "high" if unique_count > len(df) * 0.9 else
+                              ("medium" if unique_count > 10 else "low")
             }
 
             # Add type-specific info
@@ -66,25 +83,25 @@ class AnalysisService:
 
         return columns_info
 
-    def _assess_data_quality(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _assess_data_quality(self, df: pd.DataFrame, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Assess overall data quality"""
         total_cells = df.shape[0] * df.shape[1]
-        missing_cells = df.isnull().sum().sum()
+        missing_cells = stats["missing_cells"]
 
         quality = {
             "completeness_pct": round((1 - missing_cells / total_cells) * 100, 2),
-            "duplicate_rows": int(df.duplicated().sum()),
-            "duplicate_rows_pct": round(df.duplicated().mean() * 100, 2),
-            "columns_with_missing": df.columns[df.isnull().any()].tolist(),
+            "duplicate_rows": stats["duplicate_rows"],
+            "duplicate_rows_pct": round(stats["duplicate_rows_pct"], 2),
+            "columns_with_missing": stats["columns_with_missing"],
             "high_cardinality_columns": [
                 col for col in df.columns
-                if df[col].nunique() > len(df) * 0.9
+                if stats["nunique"][col] > len(df) * 0.9
             ]
         }
 
         return quality
 
-    def _generate_insights(self, df: pd.DataFrame, schema: dict) -> List[str]:
+    def _generate_insights(self, df: pd.DataFrame, schema: dict, stats: Dict[str, Any]) -> List[str]:
         """Generate key insights about the data"""
         insights = []
 
@@ -95,7 +112,7 @@ class AnalysisService:
             insights.append(f"Small dataset with {len(df)} rows - limited for statistical inference")
 
         # Missing data insight
-        missing_pct = (df.isnull().sum().sum() / (df.shape[0] * df.shape[1])) * 100
+        missing_pct = (stats["missing_cells"] / (df.shape[0] * df.shape[1])) * 100
         if missing_pct > 20:
             insights.append(f"Significant missing data ({missing_pct:.1f}%) - consider data cleaning")
         elif missing_pct == 0:
@@ -117,12 +134,12 @@ class AnalysisService:
             insights.append(f"Contains {len(datetime_cols)} datetime columns suitable for time-series analysis")
 
         # Duplicate rows
-        if df.duplicated().sum() > 0:
-            insights.append(f"Found {df.duplicated().sum()} duplicate rows - consider deduplication")
+        if stats["duplicate_rows"] > 0:
+            insights.append(f"Found {stats['duplicate_rows']} duplicate rows - consider deduplication")
 
         return insights
 
-    def _generate_suggestions(self, df: pd.DataFrame, schema: dict) -> List[str]:
+    def _generate_suggestions(self, df: pd.DataFrame, schema: dict, stats: Dict[str, Any]) -> List[str]:
         """Generate actionable suggestions"""
         suggestions = []
 
@@ -142,7 +159,7 @@ class AnalysisService:
             suggestions.append(f"Try: 'Show distribution of {categorical_cols[0]}'")
 
         # Data quality suggestions
-        missing_cols = df.columns[df.isnull().any()].tolist()
+        missing_cols = stats["columns_with_missing"]
         if missing_cols:
             suggestions.append(f"Consider handling missing values in: {', '.join(missing_cols[:3])}")
 
@@ -6,6 +6,9 @@ import traceback
 import signal
 import subprocess
 import sys
+import os
+import multiprocessing
+import threading
 from typing import Dict, Any, Optional
 from contextlib import contextmanager
 from app.core.config import settings
@@ -16,6 +19,34 @@ class ExecutionTimeout(Exception):
     pass
 
 
+# Generated code runs in its own spawned process per execution: pyplot's
+# figure state stays private to the run, and a run stuck in C code (pandas,
+# DuckDB) can still be killed when it times out.
+_spawn_context = multiprocessing.get_context('spawn')
+
+# Extra time a run gets beyond its timeout for the child to start and
+# import pandas and the ML libraries
+_STARTUP_GRACE_SECONDS = 30
+
+# Bounds how many execution processes (each loading the dataset) run at once
+_execution_slots = threading.BoundedSemaphore(max(1, (os.cpu_count() or 2) // 2))
+
+
+def _execute_in_child(conn, code: str, dataset_id: str, timeout_sec: int):
+    """Process entry point: run the code and send the result dict back"""
+    try:
+        result = CodeExecutorService()._execute_python(code, dataset_id, timeout_sec)
+    except Exception as e:
+        result = {
+            'status': 'FAILED',
+            'error': str(e),
+            'error_trace': traceback.format_exc(),
+            'output': None
+        }
+    conn.send(result)
+    conn.close()
+
+
 class CodeExecutorService:
     """Safely execute Python code with sandboxing and resource limits"""
 
@@ -144,7 +175,8 @@ class CodeExecutorService:
 
     @contextmanager
     def timeout_context(self, seconds: int):
-        """Context manager for execution timeout"""
+        """Context manager for execution timeout (main thread only, as it uses SIGALRM)"""
+
         def timeout_handler(signum, frame):
             raise ExecutionTimeout(f"Execution exceeded {seconds} seconds")
 
@@ -165,14 +197,53 @@ class CodeExecutorService:
         dataset_id: str,
         timeout_sec: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Execute Python code in a sandboxed environment"""
+        """Execute Python code in a sandboxed environment
 
+        The code runs in a separate process that is killed if it outlives
+        its timeout. Blocks until then, so call it from a worker thread.
+        """
         if timeout_sec is None:
             timeout_sec = 60  # Default 1 minute
 
         if timeout_sec > self.max_timeout_seconds:
             timeout_sec = self.max_timeout_seconds
 
+        with _execution_slots:
+            receiver, sender = _spawn_context.Pipe(duplex=False)
+            process = _spawn_context.Process(
+                target=_execute_in_child,
+                args=(sender, code, dataset_id, timeout_sec)
+            )
+            process.start()
+            sender.close()
+            try:
+                if receiver.poll(timeout_sec + _STARTUP_GRACE_SECONDS):
+                    return receiver.recv()
+                return {
+                    'status': 'TIMEOUT',
+                    'error': f"Execution exceeded {timeout_sec} seconds",
+                    'output': None
+                }
+            except EOFError:
+                return {
+                    'status': 'FAILED',
+                    'error': f"Execution process exited unexpectedly (exit code {process.exitcode})",
+                    'output': None
+                }
+            finally:
+                if process.is_alive():
+                    process.kill()
+                process.join()
+                receiver.close()
+
+    def _execute_python(
+        self,
+        code: str,
+        dataset_id: str,
+        timeout_sec: int
+    ) -> Dict[str, Any]:
+        """Run the code in this process; used by the execution child process"""
+
         # Prepare safe execution environment
         parquet_path = f"{settings.DATASETS_DIR}/{dataset_id}/data.parquet"
 
@@ -225,7 +296,7 @@ class CodeExecutorService:
         duckdb = libs.get('duckdb')
 
         # Load the dataset (can be replaced by DuckDB query in generated code)
-        df = pd.read_parquet(parquet_path)
+        df = pd.read_parquet(parquet_path, memory_map=True)
 
         # Create DuckDB connection with dataset view (matches SQL execution pattern)
         # This allows generated code to query "dataset" table directly
@@ -274,12 +345,6 @@ class CodeExecutorService:
                 # Fallback: handle matplotlib figures if any were created
                 visualizations = self.extract_visualizations(plt, plot_data)
 
-            # Close all plots to free memory
-            plt.close('all')
-
-            # Close DuckDB connection
-            duckdb_conn.close()
-
             # Validate result is JSON-serializable
             if result is not None:
                 result = self.make_json_serializable(result)
@@ -293,17 +358,15 @@ class CodeExecutorService:
             }
 
         except ExecutionTimeout as e:
-            duckdb_conn.close()
             return {
                 'status': 'TIMEOUT',
-                'error': str(e),
+                'error': str(e) or f"Execution exceeded {timeout_sec} seconds",
                 'output': None
             }
 
         except Exception as e:
             # Capture full traceback
             error_trace = traceback.format_exc()
-            duckdb_conn.close()
 
             return {
                 'status': 'FAILED',
@@ -312,6 +375,11 @@ class CodeExecutorService:
                 'output': None
             }
 
+        finally:
+            # Close all plots so none leak into the next run's visualizations
+            plt.close('all')
+            duckdb_conn.close()
+
     def extract_visualizations(self, plt, plot_base64: Optional[str]) -> list:
         """Extract visualizations from matplotlib"""
 
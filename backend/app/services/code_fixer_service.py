@@ -2,10 +2,10 @@
 Service to automatically fix common code generation errors
 """
 import re
-import httpx
 import json
 from typing import Dict, Any, Optional
 from app.core.config import settings
+from app.core.http_client import get_http_client
 
 
 class CodeFixerService:
@@ -48,37 +48,37 @@ REQUIREMENTS:
 FIXED CODE:"""
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": settings.OPENROUTER_MODEL,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.1  # Very low temperature for precise fixes
-                    }
-                )
-
-                if response.status_code != 200:
-                    print(f"❌ LLM fix failed: HTTP {response.status_code}")
-                    return None
-
-                result = response.json()
-
-                if 'choices' not in result or len(result['choices']) == 0:
-                    print(f"❌ LLM fix failed: Unexpected response format")
-                    return None
-
-                fixed_code = result['choices'][0]['message']['content']
-
-                # Clean up code (remove markdown if present)
-                fixed_code = fixed_code.replace('```python', '').replace('```', '').strip()
-
-                print(f"✅ LLM generated fixed code")
-                return fixed_code
+            response = await get_http_client().post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": settings.OPENROUTER_MODEL,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0.1  # Very low temperature for precise fixes
+                },
+                timeout=30.0
+            )
+
+            if response.status_code != 200:
+                print(f"❌ LLM fix failed: HTTP {response.status_code}")
+                return None
+
+            result = response.json()
+
+            if 'choices' not in result or len(result['choices']) == 0:
+                print(f"❌ LLM fix failed: Unexpected response format")
+                return None
+
+            fixed_code = result['choices'][0]['message']['content']
+
+            # Clean up code (remove markdown if present)
+            fixed_code = fixed_code.replace('```python', '').replace('```', '').strip()
+
+            print(f"✅ LLM generated fixed code")
+            return fixed_code
 
         except Exception as e:
             print(f"❌ LLM fix error: {e}")
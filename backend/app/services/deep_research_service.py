@@ -11,21 +11,44 @@ Multi-stage pipeline for comprehensive data analysis:
 """
 
 import json
-import httpx
 import time
-from typing import Dict, Any, List, Optional
+import asyncio
+from collections import Counter
+from typing import AsyncIterator, Dict, Any, List, Optional
 from datetime import datetime
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.services.storage_service import StorageService
 from app.services.nl_to_sql_service import NLToSQLService
 from app.services.nl_to_python_service import NLToPythonService
 from app.services.code_executor_service import CodeExecutorService
 from app.services.duckdb_service import DuckDBService
+from app.services.research_cache import StageCache
+
+# Memoized stage outputs must hold a non-empty list under this key whose
+# items all carry these fields; anything else (an empty decomposition, a
+# truncated reply) is used once but not cached
+_CACHEABLE_STAGE_SHAPES = {
+    'decompose': ('sub_questions', ('question', 'intent_type', 'desired_output')),
+    'classify': ('classifications', ('category',)),
+    'world_knowledge': ('knowledge', ('question', 'answer')),
+}
+
+
+def _is_cacheable_stage_output(stage: str, parsed: Any) -> bool:
+    key, fields = _CACHEABLE_STAGE_SHAPES[stage]
+    items = parsed.get(key) if isinstance(parsed, dict) else None
+    return bool(items) and isinstance(items, list) and all(
+        isinstance(item, dict) and all(field in item for field in fields)
+        for item in items
+    )
 
 
 class SubQuestion:
     """Structured representation of a sub-question"""
+    __slots__ = ('question', 'intent_type', 'desired_output', 'priority')
+
     def __init__(self,
                  question: str,
                  intent_type: str,
@@ -36,6 +59,16 @@ class SubQuestion:
         self.desired_output = desired_output  # table, number, explanation, chart
         self.priority = priority
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SubQuestion':
+        """Build from a client-supplied dict, filling in defaults for missing fields"""
+        return cls(
+            data['question'],
+            data.get('intent_type', 'descriptive'),
+            data.get('desired_output', 'table'),
+            data.get('priority', 2)
+        )
+
 
 class ClassifiedQuestion:
     """Question with data/knowledge classification"""
@@ -88,17 +121,57 @@ class DeepResearchService:
                       enable_python: bool = True,
                       enable_world_knowledge: bool = True,
                       verbose_mode: bool = True,
-                      progress_callback: Optional[callable] = None) -> Dict[str, Any]:
+                      progress_callback: Optional[callable] = None,
+                      stage_cache: Optional[StageCache] = None,
+                      sub_question_concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Execute full deep research pipeline and return the analysis
+
+        See research_stream for the result; progress_callback, if given, is
+        awaited with (stage, message) as each stage starts.
         """
-        Execute full deep research pipeline
+        result = None
+        async for update in self.research_stream(
+            main_question,
+            dataset_id,
+            max_sub_questions=max_sub_questions,
+            enable_python=enable_python,
+            enable_world_knowledge=enable_world_knowledge,
+            verbose_mode=verbose_mode,
+            stage_cache=stage_cache,
+            sub_question_concurrency=sub_question_concurrency
+        ):
+            if update.get('type') == 'complete':
+                result = update['result']
+            elif progress_callback:
+                await progress_callback(update['stage'], update['message'])
+        return result
+
+    async def research_stream(self,
+                             main_question: str,
+                             dataset_id: str,
+                             max_sub_questions: int = 10,
+                             enable_python: bool = True,
+                             enable_world_knowledge: bool = True,
+                             verbose_mode: bool = True,
+                             stage_cache: Optional[StageCache] = None,
+                             sub_question_concurrency: int = 8) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute full deep research pipeline, yielding progress as it goes
+
+        Yields {'stage', 'message'} when each stage starts, then a final
+        {'type': 'complete', 'result'} whose result is the analysis:
 
-        Returns comprehensive analysis with:
         - Direct answer
         - Key findings
         - Supporting details
         - Data coverage & gaps
         - Suggested next questions
         - (Optional) Verbose analysis with executive summary, methodology, detailed findings, etc.
+
+        If stage_cache is given, decomposition, classification and world
+        knowledge outputs are reused from earlier runs on the same dataset.
+        Up to sub_question_concurrency sub-questions are answered at once.
         """
 
         start_time = time.time()
@@ -109,49 +182,77 @@ class DeepResearchService:
 
         # Stage 1: Question Understanding & Decomposition
         print(f"[{research_id}] Stage 1: Decomposing question...")
-        if progress_callback:
-            await progress_callback(1, "Decomposing question into sub-questions...")
+        yield {'stage': 1, 'message': "Decomposing question into sub-questions..."}
         sub_questions = await self._decompose_question(
             main_question,
             schema,
-            max_sub_questions
+            max_sub_questions,
+            stage_cache
         )
 
         # Stage 2: Question Classification & Schema Mapping
         print(f"[{research_id}] Stage 2: Classifying {len(sub_questions)} sub-questions...")
-        if progress_callback:
-            await progress_callback(2, f"Classifying {len(sub_questions)} sub-questions and mapping to schema...")
-        classified = await self._classify_and_map(sub_questions, schema)
+        yield {'stage': 2, 'message': f"Classifying {len(sub_questions)} sub-questions and mapping to schema..."}
+        classified = await self._classify_and_map(sub_questions, schema, stage_cache)
+
+        async for update in self._research_from_classified(
+            research_id,
+            start_time,
+            main_question,
+            dataset_id,
+            schema,
+            sub_questions,
+            classified,
+            enable_python=enable_python,
+            enable_world_knowledge=enable_world_knowledge,
+            verbose_mode=verbose_mode,
+            stage_cache=stage_cache,
+            sub_question_concurrency=sub_question_concurrency
+        ):
+            yield update
+
+    async def _research_from_classified(self,
+                                        research_id: str,
+                                        start_time: float,
+                                        main_question: str,
+                                        dataset_id: str,
+                                        schema: Dict,
+                                        sub_questions: List[SubQuestion],
+                                        classified: List[ClassifiedQuestion],
+                                        enable_python: bool,
+                                        enable_world_knowledge: bool,
+                                        verbose_mode: bool,
+                                        stage_cache: Optional[StageCache],
+                                        sub_question_concurrency: int) -> AsyncIterator[Dict[str, Any]]:
+        """Stages 3 onwards of research_stream, given the classified sub-questions"""
 
         # Stage 3: Query Execution
         print(f"[{research_id}] Stage 3: Executing queries...")
-        if progress_callback:
-            await progress_callback(3, "Executing SQL and Python queries...")
+        yield {'stage': 3, 'message': "Executing SQL and Python queries..."}
         results = await self._execute_queries(
             classified,
             dataset_id,
             schema,
-            enable_python
+            enable_python,
+            sub_question_concurrency
         )
 
         # Stage 4: World Knowledge Enrichment
         world_knowledge = {}
         if enable_world_knowledge:
             print(f"[{research_id}] Stage 4: Enriching with world knowledge...")
-            if progress_callback:
-                await progress_callback(4, "Enriching with world knowledge and context...")
+            yield {'stage': 4, 'message': "Enriching with world knowledge and context..."}
             world_knowledge = await self._enrich_world_knowledge(
                 classified,
-                results
+                results,
+                stage_cache
             )
         else:
-            if progress_callback:
-                await progress_callback(4, "Skipping world knowledge enrichment...")
+            yield {'stage': 4, 'message': "Skipping world knowledge enrichment..."}
 
         # Stage 5: Synthesis & Insight Generation
         print(f"[{research_id}] Stage 5: Synthesizing insights...")
-        if progress_callback:
-            await progress_callback(5, "Synthesizing insights and generating findings...")
+        yield {'stage': 5, 'message': "Synthesizing insights and generating findings..."}
         synthesis = await self._synthesize_insights(
             main_question,
             sub_questions,
@@ -161,31 +262,36 @@ class DeepResearchService:
             schema
         )
 
-        # Stage 6: Suggest Follow-ups
+        # Stage 6: Suggest Follow-ups. Only needs the synthesis, so it runs
+        # concurrently with Stage 7
         print(f"[{research_id}] Stage 6: Generating follow-up questions...")
-        if progress_callback:
-            await progress_callback(6, "Generating follow-up questions...")
-        follow_ups = await self._suggest_follow_ups(
+        yield {'stage': 6, 'message': "Generating follow-up questions..."}
+        follow_ups_task = asyncio.create_task(self._suggest_follow_ups(
             main_question,
             synthesis,
             schema
-        )
+        ))
 
-        # Stage 7 (Optional): Generate Verbose Analysis
-        verbose_analysis = {}
-        if verbose_mode:
-            print(f"[{research_id}] Stage 7: Generating verbose multi-page analysis...")
-            if progress_callback:
-                await progress_callback(7, "Generating comprehensive report with detailed analysis...")
-            verbose_analysis = await self._generate_verbose_analysis(
-                main_question,
-                sub_questions,
-                classified,
-                results,
-                world_knowledge,
-                synthesis,
-                schema
-            )
+        try:
+            # Stage 7 (Optional): Generate Verbose Analysis
+            verbose_analysis = {}
+            if verbose_mode:
+                print(f"[{research_id}] Stage 7: Generating verbose multi-page analysis...")
+                yield {'stage': 7, 'message': "Generating comprehensive report with detailed analysis..."}
+                verbose_analysis = await self._generate_verbose_analysis(
+                    main_question,
+                    sub_questions,
+                    classified,
+                    results,
+                    world_knowledge,
+                    synthesis,
+                    schema
+                )
+
+            follow_up_questions = await follow_ups_task
+        finally:
+            if not follow_ups_task.done():
+                follow_ups_task.cancel()
 
         # Track execution time
         execution_time = time.time() - start_time
@@ -198,15 +304,6 @@ class DeepResearchService:
             'methods_used': list(set(r.method for r in results))
         }
 
-        # Extract just the question text from follow_ups
-        follow_up_questions = []
-        if isinstance(follow_ups, list):
-            for item in follow_ups:
-                if isinstance(item, dict):
-                    follow_up_questions.append(item.get('question', str(item)))
-                else:
-                    follow_up_questions.append(str(item))
-
         # Collect all visualizations from results
         visualizations = []
         for r in results:
@@ -227,7 +324,7 @@ class DeepResearchService:
             'sub_questions_count': len(sub_questions),
             'direct_answer': synthesis.get('direct_answer', 'Analysis in progress...'),
             'key_findings': synthesis.get('key_findings', []),
-            'supporting_details': synthesis.get('supporting_details', {}),
+            'supporting_details': synthesis.get('supporting_details', []),
             'data_coverage': data_coverage,
             'follow_up_questions': follow_up_questions,
             'visualizations': visualizations,
@@ -264,24 +361,94 @@ class DeepResearchService:
         # Filter out None values from stages_completed
         result['stages_completed'] = [s for s in result['stages_completed'] if s is not None]
 
-        return result
+        yield {'type': 'complete', 'result': result}
+
+    async def research_batch(self,
+                             questions: List[str],
+                             dataset_id: str,
+                             max_concurrent_questions: int = 3,
+                             stage_cache: Optional[StageCache] = None,
+                             max_sub_questions: int = 10,
+                             enable_python: bool = True,
+                             enable_world_knowledge: bool = True,
+                             verbose_mode: bool = True,
+                             sub_question_concurrency: int = 8) -> List[Any]:
+        """
+        Research several related questions about one dataset
+
+        The schema is loaded once and every question is decomposed, then all
+        of their sub-questions are classified and mapped to the schema in a
+        single pass. Stages 3 onwards then run per question, a few at a time
+        (each already fans out to its own sub-questions). Returns one result
+        per question, in order; a question whose pipeline failed gets its
+        exception instead of a result.
+        """
+        start_time = time.time()
+        research_id = f"research_batch_{datetime.utcnow().timestamp()}"
+        schema = self.storage_service.load_schema(dataset_id)
+
+        # Stage 1, per question
+        print(f"[{research_id}] Stage 1: Decomposing {len(questions)} questions...")
+        decomposed = await asyncio.gather(*[
+            self._decompose_question(q, schema, max_sub_questions, stage_cache)
+            for q in questions
+        ], return_exceptions=True)
+
+        # Stage 2, once for every question's sub-questions
+        planned = [i for i, d in enumerate(decomposed) if not isinstance(d, BaseException)]
+        all_sub_questions = [sq for i in planned for sq in decomposed[i]]
+        print(f"[{research_id}] Stage 2: Classifying {len(all_sub_questions)} sub-questions...")
+        try:
+            all_classified = await self._classify_and_map(all_sub_questions, schema, stage_cache)
+        except Exception as e:
+            return [d if isinstance(d, BaseException) else e for d in decomposed]
+
+        # Classifications come back in sub-question order; hand each
+        # question its own slice
+        classified_by_question: Dict[int, List[ClassifiedQuestion]] = {}
+        offset = 0
+        for i in planned:
+            count = len(decomposed[i])
+            classified_by_question[i] = all_classified[offset:offset + count]
+            offset += count
+
+        semaphore = asyncio.Semaphore(max_concurrent_questions)
+
+        async def run(i: int) -> Dict[str, Any]:
+            if isinstance(decomposed[i], BaseException):
+                raise decomposed[i]
+            async with semaphore:
+                result = None
+                async for update in self._research_from_classified(
+                    f"{research_id}_{i}",
+                    start_time,
+                    questions[i],
+                    dataset_id,
+                    schema,
+                    decomposed[i],
+                    classified_by_question[i],
+                    enable_python=enable_python,
+                    enable_world_knowledge=enable_world_knowledge,
+                    verbose_mode=verbose_mode,
+                    stage_cache=stage_cache,
+                    sub_question_concurrency=sub_question_concurrency
+                ):
+                    if update.get('type') == 'complete':
+                        result = update['result']
+                return result
+
+        return await asyncio.gather(*[run(i) for i in range(len(questions))], return_exceptions=True)
 
     async def _decompose_question(self,
                                   main_question: str,
                                   schema: Dict,
-                                  max_count: int) -> List[SubQuestion]:
+                                  max_count: int,
+                                  stage_cache: Optional[StageCache] = None) -> List[SubQuestion]:
         """Stage 1: Break down main question into focused sub-questions"""
 
-        prompt = f"""You are a data analysis expert. Decompose the user's question into specific sub-questions.
-
-Main Question: {main_question}
-
-Available Data Context:
-- Tables: {', '.join([t['name'] for t in schema.get('tables', [])])}
-- Total Columns: {len(schema.get('columns', []))}
-- Row Count: {schema.get('row_count', 'unknown')}
-
-Task: Generate {max_count} focused sub-questions that, if answered, would fully address the main question.
+        # Static instructions first, then the per-dataset context, then the
+        # question, so providers' prefix caches can reuse the common part
+        prompt = f"""You are a data analysis expert. Decompose the user's question into specific sub-questions that, if answered, would fully address the main question.
 
 For each sub-question, provide:
 1. question: The specific question text
@@ -299,10 +466,18 @@ Return ONLY valid JSON in this exact format:
       "priority": 1
     }}
   ]
-}}"""
+}}
 
-        response = await self._call_llm(prompt)
-        parsed = self._parse_json_response(response)
+Available Data Context:
+- Tables: {', '.join([t['name'] for t in schema.get('tables', [])])}
+- Total Columns: {len(schema.get('columns', []))}
+- Row Count: {schema.get('row_count', 'unknown')}
+
+Task: Generate {max_count} focused sub-questions.
+
+Main Question: {main_question}"""
+
+        parsed = await self._call_llm_json(prompt, 'decompose', stage_cache)
 
         sub_questions = []
         for sq in parsed.get('sub_questions', []):
@@ -317,7 +492,8 @@ Return ONLY valid JSON in this exact format:
 
     async def _classify_and_map(self,
                                 sub_questions: List[SubQuestion],
-                                schema: Dict) -> List[ClassifiedQuestion]:
+                                schema: Dict,
+                                stage_cache: Optional[StageCache] = None) -> List[ClassifiedQuestion]:
         """Stage 2: Classify each sub-question and map to schema"""
 
         # Build detailed schema description
@@ -328,14 +504,9 @@ Return ONLY valid JSON in this exact format:
             for i, sq in enumerate(sub_questions)
         ])
 
+        # Static instructions first, then schema, then the per-run questions
         prompt = f"""You are a database expert. Classify each sub-question and map it to the available schema.
 
-Database Schema:
-{schema_desc}
-
-Sub-Questions to Classify:
-{questions_text}
-
 For each question, determine:
 1. category: One of [data_backed, world_knowledge, insufficient_data, mixed]
    - data_backed: Can be fully answered from the database
@@ -360,10 +531,15 @@ Return ONLY valid JSON:
       "notes": "Direct aggregation of revenue column"
     }}
   ]
-}}"""
+}}
 
-        response = await self._call_llm(prompt)
-        parsed = self._parse_json_response(response)
+Database Schema:
+{schema_desc}
+
+Sub-Questions to Classify:
+{questions_text}"""
+
+        parsed = await self._call_llm_json(prompt, 'classify', stage_cache)
 
         classified = []
         for i, classification in enumerate(parsed.get('classifications', [])):
@@ -383,13 +559,18 @@ Return ONLY valid JSON:
                                classified: List[ClassifiedQuestion],
                                dataset_id: str,
                                schema: Dict,
-                               enable_python: bool) -> List[AnalysisResult]:
-        """Stage 3: Execute SQL/Python queries for data-backed questions"""
+                               enable_python: bool,
+                               concurrency: int = 8) -> List[AnalysisResult]:
+        """Stage 3: Execute SQL/Python queries for data-backed questions
 
-        results = []
+        Sub-questions are answered concurrently (bounded by concurrency so the
+        LLM provider isn't flooded); results keep the sub-question order.
+        """
 
-        for cq in classified:
-            if cq.category in ['data_backed', 'mixed'] and cq.feasibility in ['high', 'medium']:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def answer(cq: ClassifiedQuestion) -> AnalysisResult:
+            async with semaphore:
                 # Decide: SQL or Python?
                 use_python = enable_python and cq.sub_question.intent_type in [
                     'causal', 'forecasting', 'anomaly_detection', 'trend_analysis'
@@ -397,19 +578,24 @@ Return ONLY valid JSON:
 
                 if use_python:
                     # Use Python for complex analytics
-                    result = await self._execute_python_analysis(
+                    return await self._execute_python_analysis(
                         cq.sub_question.question,
                         dataset_id,
                         cq.sub_question.intent_type
                     )
-                else:
-                    # Use SQL for straightforward queries
-                    result = await self._execute_sql_query(
-                        cq.sub_question.question,
-                        dataset_id
-                    )
 
-                results.append(result)
+                # Use SQL for straightforward queries
+                return await self._execute_sql_query(
+                    cq.sub_question.question,
+                    dataset_id
+                )
+
+        # Coroutines for data-backed questions, ready results for the rest
+        results = []
+
+        for cq in classified:
+            if cq.category in ['data_backed', 'mixed'] and cq.feasibility in ['high', 'medium']:
+                results.append(answer(cq))
 
             elif cq.category == 'world_knowledge':
                 # Will be handled in enrichment stage
@@ -423,7 +609,8 @@ Return ONLY valid JSON:
                     error="Insufficient data to answer this question"
                 ))
 
-        return results
+        answers = iter(await asyncio.gather(*[r for r in results if asyncio.iscoroutine(r)]))
+        return [next(answers) if asyncio.iscoroutine(r) else r for r in results]
 
     async def _execute_sql_query(self,
                                  question: str,
@@ -433,8 +620,9 @@ Return ONLY valid JSON:
             # Generate SQL
             sql_result = await self.nl_to_sql.generate_sql(question, dataset_id)
 
-            # Execute
-            df = self.duckdb_service.execute_query(
+            # Execute off the event loop (DuckDB calls block)
+            df = await asyncio.to_thread(
+                self.duckdb_service.execute_query,
                 sql_result['sql'],
                 dataset_id
             )
@@ -470,8 +658,9 @@ Return ONLY valid JSON:
                 mode='stats' if intent_type in ['trend_analysis', 'forecasting'] else 'python'
             )
 
-            # Execute
-            exec_result = self.code_executor.execute_python(
+            # Execute off the event loop
+            exec_result = await asyncio.to_thread(
+                self.code_executor.execute_python,
                 code=code_result['code'],
                 dataset_id=dataset_id
             )
@@ -501,8 +690,13 @@ Return ONLY valid JSON:
 
     async def _enrich_world_knowledge(self,
                                       classified: List[ClassifiedQuestion],
-                                      results: List[AnalysisResult]) -> Dict[str, Any]:
-        """Stage 4: Add world knowledge context"""
+                                      results: Optional[List[AnalysisResult]] = None,
+                                      stage_cache: Optional[StageCache] = None) -> Dict[str, Any]:
+        """Stage 4: Add world knowledge context
+
+        Only the classification feeds the prompt, so this can run alongside
+        query execution; results is accepted for callers that have them.
+        """
 
         world_knowledge_questions = [
             cq for cq in classified
@@ -538,8 +732,7 @@ Return as JSON:
   ]
 }}"""
 
-        response = await self._call_llm(prompt)
-        parsed = self._parse_json_response(response)
+        parsed = await self._call_llm_json(prompt, 'world_knowledge', stage_cache)
 
         return parsed
 
@@ -609,8 +802,12 @@ Return as JSON:
     async def _suggest_follow_ups(self,
                                   main_question: str,
                                   synthesis: Dict,
-                                  schema: Dict) -> List[Dict[str, str]]:
-        """Stage 6: Suggest follow-up questions for deeper research"""
+                                  schema: Dict) -> List[str]:
+        """Stage 6: Suggest follow-up questions for deeper research
+
+        Returns just the question texts; the rationale and category the LLM
+        is asked for only steer the suggestions.
+        """
 
         prompt = f"""Based on the analysis results, suggest follow-up questions for deeper insights.
 
@@ -641,7 +838,13 @@ Return as JSON:
         response = await self._call_llm(prompt)
         parsed = self._parse_json_response(response)
 
-        return parsed.get('follow_ups', [])
+        follow_ups = parsed.get('follow_ups', [])
+        if not isinstance(follow_ups, list):
+            return []
+        return [
+            item.get('question', str(item)) if isinstance(item, dict) else str(item)
+            for item in follow_ups
+        ]
 
     async def _generate_verbose_analysis(self,
                                         main_question: str,
@@ -654,6 +857,8 @@ Return as JSON:
         """Generate comprehensive verbose analysis with multiple sections"""
 
         results_summary = self._summarize_results(results)
+        category_counts = Counter(c.category for c in classified)
+        successful_queries = sum(1 for r in results if r.success)
 
         # 1. Executive Summary (2-3 paragraphs)
         exec_summary_prompt = f"""You are a senior research analyst writing an executive summary.
@@ -677,17 +882,14 @@ Return as JSON:
   "executive_summary": "Full multi-paragraph text here..."
 }}"""
 
-        exec_response = await self._call_llm(exec_summary_prompt)
-        exec_summary = self._parse_json_response(exec_response).get('executive_summary', '')
-
         # 2. Methodology & Data Sources
         methodology = {
             "total_sub_questions": len(sub_questions),
             "data_sources": {
                 "dataset_columns": len(schema.get('columns', [])),
                 "total_rows": schema.get('row_count', 0),
-                "data_backed_queries": len([c for c in classified if c.category == 'data_backed']),
-                "world_knowledge_queries": len([c for c in classified if c.category == 'world_knowledge'])
+                "data_backed_queries": category_counts['data_backed'],
+                "world_knowledge_queries": category_counts['world_knowledge']
             },
             "analysis_methods": [
                 "SQL queries for structured data analysis",
@@ -696,9 +898,9 @@ Return as JSON:
                 "Cross-referential validation"
             ],
             "quality_metrics": {
-                "successful_queries": len([r for r in results if r.success]),
+                "successful_queries": successful_queries,
                 "total_queries": len(results),
-                "coverage_percentage": round((len([r for r in results if r.success]) / len(results) * 100) if results else 0, 1)
+                "coverage_percentage": round((successful_queries / len(results) * 100) if results else 0, 1)
             }
         }
 
@@ -708,7 +910,7 @@ Return as JSON:
 Main Question: {main_question}
 
 Sub-Questions and Results:
-{json.dumps([{{'question': sq.question, 'results': self._get_result_for_question(sq.question, results)}} for sq in sub_questions[:10]], indent=2)}
+{json.dumps([{'question': sq.question, 'results': self._get_result_for_question(sq.question, results)} for sq in sub_questions[:10]], indent=2)}
 
 For each sub-question, provide:
 - finding_title: Short descriptive title
@@ -731,9 +933,6 @@ Return as JSON:
   ]
 }}"""
 
-        detailed_response = await self._call_llm(detailed_findings_prompt)
-        detailed_findings = self._parse_json_response(detailed_response).get('detailed_findings', [])
-
         # 4. Cross-Analysis & Patterns
         cross_analysis_prompt = f"""Analyze patterns and connections across all findings.
 
@@ -757,11 +956,9 @@ Return as JSON:
   "trends": ["trend 1"]
 }}"""
 
-        cross_response = await self._call_llm(cross_analysis_prompt)
-        cross_analysis = self._parse_json_response(cross_response)
-
-        # 5. Limitations & Caveats
-        limitations_prompt = f"""Identify limitations and caveats of this analysis.
+        # 5-6. Limitations, then recommendations that build on them
+        async def limitations_and_recommendations():
+            limitations_prompt = f"""Identify limitations and caveats of this analysis.
 
 Data Coverage:
 {json.dumps(synthesis.get('data_coverage', {}), indent=2)}
@@ -787,11 +984,11 @@ Return as JSON:
   ]
 }}"""
 
-        limitations_response = await self._call_llm(limitations_prompt)
-        limitations = self._parse_json_response(limitations_response).get('limitations', [])
+            limitations_response = await self._call_llm(limitations_prompt)
+            limitations = self._parse_json_response(limitations_response).get('limitations', [])
 
-        # 6. Recommendations & Next Steps
-        recommendations_prompt = f"""Based on findings, provide actionable recommendations.
+            # 6. Recommendations & Next Steps
+            recommendations_prompt = f"""Based on findings, provide actionable recommendations.
 
 Main Question: {main_question}
 
@@ -819,8 +1016,21 @@ Return as JSON:
   ]
 }}"""
 
-        recommendations_response = await self._call_llm(recommendations_prompt)
-        recommendations = self._parse_json_response(recommendations_response).get('recommendations', [])
+            recommendations_response = await self._call_llm(recommendations_prompt)
+            recommendations = self._parse_json_response(recommendations_response).get('recommendations', [])
+            return limitations, recommendations
+
+        # Sections 1, 3, 4 and 5-6 only depend on the synthesis, so their
+        # LLM calls run concurrently
+        exec_response, detailed_response, cross_response, (limitations, recommendations) = await asyncio.gather(
+            self._call_llm(exec_summary_prompt),
+            self._call_llm(detailed_findings_prompt),
+            self._call_llm(cross_analysis_prompt),
+            limitations_and_recommendations()
+        )
+        exec_summary = self._parse_json_response(exec_response).get('executive_summary', '')
+        detailed_findings = self._parse_json_response(detailed_response).get('detailed_findings', [])
+        cross_analysis = self._parse_json_response(cross_response)
 
         # 7. Technical Appendix
         technical_appendix = {
@@ -846,10 +1056,10 @@ Return as JSON:
                 "total_rows": schema.get('row_count', 0)
             },
             "classification_breakdown": {
-                "data_backed": len([c for c in classified if c.category == 'data_backed']),
-                "world_knowledge": len([c for c in classified if c.category == 'world_knowledge']),
-                "mixed": len([c for c in classified if c.category == 'mixed']),
-                "insufficient_data": len([c for c in classified if c.category == 'insufficient_data'])
+                "data_backed": category_counts['data_backed'],
+                "world_knowledge": category_counts['world_knowledge'],
+                "mixed": category_counts['mixed'],
+                "insufficient_data": category_counts['insufficient_data']
             }
         }
 
@@ -920,20 +1130,37 @@ Return as JSON:
     async def _call_llm(self, prompt: str) -> str:
         """Call OpenRouter API"""
         print(f"🤖 [Deep Research] Calling OpenRouter API with model: {settings.OPENROUTER_MODEL}")
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": settings.OPENROUTER_MODEL,
-                    "messages": [{"role": "user", "content": prompt}]
-                }
-            )
-            response.raise_for_status()
-            return response.json()['choices'][0]['message']['content']
+        response = await get_http_client().post(
+            "https://openrouter.ai/api/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": settings.OPENROUTER_MODEL,
+                "messages": [{"role": "user", "content": prompt}]
+            },
+            timeout=60.0
+        )
+        response.raise_for_status()
+        return response.json()['choices'][0]['message']['content']
+
+    async def _call_llm_json(self,
+                             prompt: str,
+                             stage: str,
+                             stage_cache: Optional[StageCache] = None) -> Dict:
+        """Call the LLM and parse its JSON reply, memoized per prompt when a stage cache is given"""
+        async def compute():
+            return self._parse_json_response(await self._call_llm(prompt))
+
+        if stage_cache is None:
+            return await compute()
+        return await stage_cache.get_or_compute(
+            stage,
+            prompt,
+            compute,
+            cacheable=lambda parsed: _is_cacheable_stage_output(stage, parsed)
+        )
 
     def _parse_json_response(self, response: str) -> Dict:
         """Extract and parse JSON from LLM response"""
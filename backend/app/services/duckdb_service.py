@@ -27,7 +27,7 @@ class DuckDBService:
             result = conn.execute(sql).fetchdf()
 
             # Enforce row limit
-            if len(result) > settings.MAX_QUERY_ROWS:
+            if result.shape[0] > settings.MAX_QUERY_ROWS:
                 result = result.head(settings.MAX_QUERY_ROWS)
 
             return result
@@ -1,13 +1,21 @@
 import numpy as np
+from functools import lru_cache
 from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Any
 
 
+@lru_cache(maxsize=1)
+def _load_model() -> SentenceTransformer:
+    """Load the sentence-transformers model once per process"""
+    return SentenceTransformer('all-MiniLM-L6-v2')  # 384 dimensions
+
+
 class EmbeddingService:
     """Generate and manage embeddings for column matching"""
 
     def __init__(self):
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')  # 384 dimensions
+        # Shared across instances; services are constructed per request
+        self.model = _load_model()
 
     def generate_column_embeddings(self, columns: List[Dict[str, Any]]) -> np.ndarray:
         """Generate embeddings for column descriptions"""
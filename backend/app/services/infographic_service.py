@@ -16,6 +16,7 @@ import base64
 import json
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from reportlab.lib import colors
@@ -100,7 +101,8 @@ class InfographicService:
                            format: str = 'pdf',
                            include_charts: bool = True,
                            include_visualizations: bool = True,
-                           generation_method: str = 'template') -> Dict[str, Any]:
+                           generation_method: str = 'template',
+                           raw: bool = False) -> Dict[str, Any]:
         """
         Generate infographic from deep research results
 
@@ -110,27 +112,35 @@ class InfographicService:
             include_charts: Whether to generate summary charts
             include_visualizations: Whether to include existing visualizations
             generation_method: 'template' (default, free) or 'ai' (Gemini Nano Banana Pro, paid)
+            raw: Return the file itself as 'raw_bytes' instead of base64 'data'
 
         Returns:
-            Dict with 'data' (base64 encoded), 'format', 'filename'
+            Dict with 'data' (base64 encoded) or, with raw, 'raw_bytes';
+            plus 'format', 'filename', 'size_bytes'
         """
 
         if generation_method == 'ai':
-            return self._generate_ai_infographic(research_result, format)
+            result = self._generate_ai_infographic(research_result, format)
         elif generation_method == 'template':
             if format == 'pdf':
-                return self._generate_pdf_infographic(
+                result = self._generate_pdf_infographic(
                     research_result,
                     include_charts,
                     include_visualizations
                 )
             elif format == 'png':
-                return self._generate_png_infographic(research_result)
+                result = self._generate_png_infographic(research_result)
             else:
                 raise ValueError(f"Unsupported format: {format}")
         else:
             raise ValueError(f"Unsupported generation method: {generation_method}")
 
+        # Generators return the file bytes; only encode when the caller
+        # wants base64
+        if not raw:
+            result['data'] = base64.b64encode(result.pop('raw_bytes')).decode('utf-8')
+        return result
+
     def _generate_pdf_infographic(self,
                                   research_result: Dict[str, Any],
                                   include_charts: bool,
@@ -191,17 +201,15 @@ class InfographicService:
         # Build PDF
         doc.build(story, onFirstPage=self._add_page_number, onLaterPages=self._add_page_number)
 
-        # Get PDF bytes and encode
+        # Get PDF bytes
         pdf_bytes = buffer.getvalue()
         buffer.close()
 
-        encoded = base64.b64encode(pdf_bytes).decode('utf-8')
-
         timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
         filename = f"research_infographic_{timestamp}.pdf"
 
         return {
-            'data': encoded,
+            'raw_bytes': pdf_bytes,
             'format': 'pdf',
             'filename': filename,
             'size_bytes': len(pdf_bytes)
@@ -437,7 +445,7 @@ class InfographicService:
 
         elements.append(Paragraph("Supporting Analysis", self.styles['CustomHeading']))
 
-        details = research_result.get('supporting_details', {})
+        details = research_result.get('supporting_details', [])
 
         if isinstance(details, list):
             for detail in details[:10]:  # Limit to 10 details
@@ -556,17 +564,14 @@ class InfographicService:
         fig.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
         buffer.seek(0)
 
-        # Encode
         png_bytes = buffer.getvalue()
         buffer.close()
 
-        encoded = base64.b64encode(png_bytes).decode('utf-8')
-
         timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
         filename = f"research_infographic_{timestamp}.png"
 
         return {
-            'data': encoded,
+            'raw_bytes': png_bytes,
             'format': 'png',
             'filename': filename,
             'size_bytes': len(png_bytes)
@@ -585,7 +590,7 @@ class InfographicService:
             format: 'pdf' or 'png' (AI generates PNG, optionally converts to PDF)
 
         Returns:
-            Dict with base64 encoded infographic data
+            Dict with the infographic file as 'raw_bytes'
         """
         import httpx
         from app.core.config import settings
@@ -669,19 +674,19 @@ The infographic should be suitable for business/enterprise presentations."""
                     if image_url.startswith('data:image'):
                         # Extract base64 data from data URL
                         # Format: data:image/png;base64,<base64_data>
-                        image_base64 = image_url.split(',')[1]
+                        image_bytes = base64.b64decode(image_url.split(',')[1])
                     else:
                         # Download from URL if it's a regular URL
                         with httpx.Client() as dl_client:
                             img_response = dl_client.get(image_url)
                             img_response.raise_for_status()
-                            image_base64 = base64.b64encode(img_response.content).decode('utf-8')
+                            image_bytes = img_response.content
                 else:
                     raise ValueError("No images found in API response")
 
                 # If PDF requested, convert PNG to PDF
                 if format == 'pdf':
-                    image_base64 = self._convert_png_to_pdf(image_base64)
+                    image_bytes = self._convert_png_to_pdf(image_bytes)
                     file_format = 'pdf'
                 else:
                     file_format = 'png'
@@ -689,14 +694,11 @@ The infographic should be suitable for business/enterprise presentations."""
                 timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
                 filename = f"research_infographic_ai_{timestamp}.{file_format}"
 
-                # Calculate size
-                size_bytes = len(base64.b64decode(image_base64))
-
                 return {
-                    'data': image_base64,
+                    'raw_bytes': image_bytes,
                     'format': file_format,
                     'filename': filename,
-                    'size_bytes': size_bytes,
+                    'size_bytes': len(image_bytes),
                     'generation_method': 'ai',
                     'model': 'google/gemini-3-pro-image-preview'
                 }
@@ -708,13 +710,11 @@ The infographic should be suitable for business/enterprise presentations."""
         except Exception as e:
             raise Exception(f"AI infographic generation failed: {str(e)}")
 
-    def _convert_png_to_pdf(self, png_base64: str) -> str:
+    def _convert_png_to_pdf(self, png_bytes: bytes) -> bytes:
         """Convert PNG image to PDF format"""
         from reportlab.pdfgen import canvas
         from PIL import Image as PILImage
 
-        # Decode PNG
-        png_bytes = base64.b64decode(png_base64)
         img = PILImage.open(io.BytesIO(png_bytes))
 
         # Create PDF
@@ -750,6 +750,18 @@ The infographic should be suitable for business/enterprise presentations."""
         c.save()
         buffer.seek(0)
 
-        # Encode to base64
-        pdf_bytes = buffer.getvalue()
-        return base64.b64encode(pdf_bytes).decode('utf-8')
+        return buffer.getvalue()
+
+
+@lru_cache(maxsize=8)
+def _service_for(template: str) -> InfographicService:
+    return InfographicService(template=template)
+
+
+def render_infographic(template: str, research_result: Dict[str, Any], **options) -> Dict[str, Any]:
+    """Generate an infographic with the per-process service for a template
+
+    Module-level so it can be submitted to a process pool; each worker
+    builds (and keeps) its own service instances.
+    """
+    return _service_for(template).generate_infographic(research_result=research_result, **options)
@@ -1,7 +1,7 @@
 import json
-import httpx
 from typing import Dict, Any, List, Optional
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.services.storage_service import StorageService
 from app.services.embedding_service import EmbeddingService
 from app.services.nl_to_sql_service import NLToSQLService
@@ -256,41 +256,41 @@ Focus on:
     async def call_openrouter(self, prompt: str) -> str:
         """Call OpenRouter API for code generation"""
         print(f"🤖 [Python] Calling OpenRouter API with model: {settings.OPENROUTER_MODEL}")
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": settings.OPENROUTER_MODEL,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.3  # Lower temperature for more deterministic code
-                }
-            )
-
-            # Check response status
-            if response.status_code != 200:
-                error_detail = response.text
-                raise Exception(f"OpenRouter API error (status {response.status_code}): {error_detail}")
-
-            result = response.json()
-
-            # Check for error in response
-            if 'error' in result:
-                raise Exception(f"OpenRouter API error: {result['error']}")
-
-            # Extract code from response
-            if 'choices' not in result or len(result['choices']) == 0:
-                raise Exception(f"Unexpected API response format: {json.dumps(result)}")
-
-            code = result['choices'][0]['message']['content']
-
-            # Clean up code (remove markdown if present)
-            code = code.replace('```python', '').replace('```', '').strip()
-
-            return code
+        response = await get_http_client().post(
+            "https://openrouter.ai/api/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": settings.OPENROUTER_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.3  # Lower temperature for more deterministic code
+            },
+            timeout=60.0
+        )
+
+        # Check response status
+        if response.status_code != 200:
+            error_detail = response.text
+            raise Exception(f"OpenRouter API error (status {response.status_code}): {error_detail}")
+
+        result = response.json()
+
+        # Check for error in response
+        if 'error' in result:
+            raise Exception(f"OpenRouter API error: {result['error']}")
+
+        # Extract code from response
+        if 'choices' not in result or len(result['choices']) == 0:
+            raise Exception(f"Unexpected API response format: {json.dumps(result)}")
+
+        code = result['choices'][0]['message']['content']
+
+        # Clean up code (remove markdown if present)
+        code = code.replace('```python', '').replace('```', '').strip()
+
+        return code
 
     def parse_workflow(self, code: str, mode: str) -> List[Dict[str, Any]]:
         """Parse code into workflow steps"""
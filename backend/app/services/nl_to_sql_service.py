@@ -1,8 +1,8 @@
 import json
-import httpx
 from typing import Dict, Any
 from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.services.storage_service import StorageService
 from app.services.embedding_service import EmbeddingService
 from app.services.rule_service import RuleService
@@ -119,35 +119,35 @@ SQL Query:"""
     async def call_openrouter(self, prompt: str) -> str:
         """Call OpenRouter API"""
         print(f"🤖 Calling OpenRouter API with model: {settings.OPENROUTER_MODEL}")
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": settings.OPENROUTER_MODEL,
-                    "messages": [{"role": "user", "content": prompt}]
-                }
-            )
-
-            # Check response status
-            if response.status_code != 200:
-                error_detail = response.text
-                raise Exception(f"OpenRouter API error (status {response.status_code}): {error_detail}")
-
-            result = response.json()
-
-            # Check for error in response
-            if 'error' in result:
-                raise Exception(f"OpenRouter API error: {result['error']}")
-
-            # Extract SQL from response
-            if 'choices' not in result or len(result['choices']) == 0:
-                raise Exception(f"Unexpected API response format: {json.dumps(result)}")
-
-            return result['choices'][0]['message']['content']
+        response = await get_http_client().post(
+            "https://openrouter.ai/api/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": settings.OPENROUTER_MODEL,
+                "messages": [{"role": "user", "content": prompt}]
+            },
+            timeout=30.0
+        )
+
+        # Check response status
+        if response.status_code != 200:
+            error_detail = response.text
+            raise Exception(f"OpenRouter API error (status {response.status_code}): {error_detail}")
+
+        result = response.json()
+
+        # Check for error in response
+        if 'error' in result:
+            raise Exception(f"OpenRouter API error: {result['error']}")
+
+        # Extract SQL from response
+        if 'choices' not in result or len(result['choices']) == 0:
+            raise Exception(f"Unexpected API response format: {json.dumps(result)}")
+
+        return result['choices'][0]['message']['content']
 
     def apply_guardrails(self, sql: str) -> str:
         """Apply safety guardrails to SQL"""
@@ -0,0 +1,280 @@
+"""
+Result cache for the deep research pipeline
+
+A full research run costs several LLM calls plus SQL/Python execution, so
+repeated requests against an unchanged dataset are served from Redis:
+
+1. Exact match on the normalized question + pipeline flags
+2. Semantic match: the question embedding is compared against earlier
+   questions for the same dataset version and flags; a close paraphrase
+   that mentions the same numbers, years and named/quoted terms reuses
+   that answer, flagged as a paraphrase hit
+
+Keys include the dataset's updated_at, so any dataset change misses.
+
+StageCache additionally memoizes the LLM planning stages (decomposition,
+classification, world knowledge) by prompt, so related questions that
+produce the same sub-questions skip those calls even on a result miss.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.core.cache import cache_get_json, cache_set_json
+from app.services.embedding_service import EmbeddingService
+
+RESEARCH_CACHE_TTL_SECONDS = 3600
+
+# Planning stages depend only on the prompt and dataset version, so they can
+# live longer than full results
+STAGE_CACHE_TTL_SECONDS = 86400
+
+# Cosine similarity above which two questions are treated as the same
+SEMANTIC_SIMILARITY_THRESHOLD = 0.93
+
+# Most recent questions kept per (dataset version, flags) index
+SEMANTIC_INDEX_SIZE = 100
+
+
+def _digest(payload: Dict[str, Any]) -> str:
+    return hashlib.blake2b(
+        json.dumps(payload, sort_keys=True, default=str).encode(),
+        digest_size=20
+    ).hexdigest()
+
+
+def _normalize_question(question: str) -> str:
+    return ' '.join(question.split()).lower()
+
+
+_NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+_QUOTED_PATTERN = re.compile(r'["\u201c\u201d]([^"\u201c\u201d]+)["\u201c\u201d]')
+_CAPITALISED_PATTERN = re.compile(r"\b[A-Z][\w-]*")
+
+
+def _anchor_terms(question: str) -> FrozenSet[str]:
+    """Numbers, years, quoted phrases and capitalised words in a question
+
+    Embeddings barely separate "revenue in 2023" from "revenue in 2024", so
+    a paraphrase only counts as the same question if these match exactly.
+    The first word is skipped since it is capitalised anyway.
+    """
+    terms = set(_NUMBER_PATTERN.findall(question))
+    terms.update(phrase.strip().lower() for phrase in _QUOTED_PATTERN.findall(question))
+    first_word = question.split(maxsplit=1)[0] if question.strip() else ''
+    terms.update(
+        word.lower() for word in _CAPITALISED_PATTERN.findall(question)
+        if word != first_word
+    )
+    return frozenset(terms)
+
+
+def research_cache_key(dataset_id: str,
+                       dataset_updated_at: datetime,
+                       question: str,
+                       **params: Any) -> str:
+    """Build a canonical cache key for a research request"""
+    digest = _digest({
+        'dataset_id': dataset_id,
+        'dataset_updated_at': dataset_updated_at.isoformat(),
+        'question': _normalize_question(question),
+        **params
+    })
+    return f"research:{dataset_id}:{digest}"
+
+
+def _semantic_index_key(dataset_id: str, dataset_updated_at: datetime, **params: Any) -> str:
+    digest = _digest({
+        'dataset_id': dataset_id,
+        'dataset_updated_at': dataset_updated_at.isoformat(),
+        **params
+    })
+    return f"research_index:{dataset_id}:{digest}"
+
+
+class EmbedBatcher:
+    """Coalesces concurrent embedding requests into one model call
+
+    Texts submitted within max_wait_seconds of the first pending one are
+    encoded together in a worker thread, so a burst of cache lookups costs
+    one forward pass instead of one per request.
+    """
+
+    def __init__(self, max_wait_seconds: float = 0.01, max_batch_size: int = 64):
+        self.max_wait_seconds = max_wait_seconds
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Unit-length float32 embedding of text"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self):
+        await asyncio.sleep(self.max_wait_seconds)
+        # Texts queued while a batch is encoding go out in the next one
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            try:
+                vectors = await asyncio.to_thread(
+                    EmbeddingService().model.encode,
+                    [text for text, _ in batch],
+                    batch_size=len(batch),
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), vector in zip(batch, vectors):
+                    if not future.done():
+                        future.set_result(np.asarray(vector, dtype=np.float32))
+        self._flusher = None
+
+
+_embed_batcher = EmbedBatcher()
+
+
+async def _embed_question(question: str) -> np.ndarray:
+    """Unit-length embedding of a question, batched with concurrent lookups"""
+    return await _embed_batcher.embed(_normalize_question(question))
+
+
+class CachedResearch(NamedTuple):
+    """A cache hit; paraphrase is set when it answers a different wording"""
+    result: Dict[str, Any]
+    paraphrase: bool
+
+
+async def get_cached_research(dataset_id: str,
+                              dataset_updated_at: datetime,
+                              question: str,
+                              **params: Any) -> Optional[CachedResearch]:
+    """Return a cached result for this request or a close paraphrase, or None
+
+    The semantic lookup is best-effort: any failure in it is a miss.
+    """
+    result = await cache_get_json(
+        research_cache_key(dataset_id, dataset_updated_at, question, **params)
+    )
+    if result is not None:
+        return CachedResearch(result, paraphrase=False)
+
+    try:
+        result = await _get_paraphrase(dataset_id, dataset_updated_at, question, **params)
+    except Exception as e:
+        print(f"Semantic cache lookup failed for dataset {dataset_id}: {e}")
+        return None
+    return CachedResearch(result, paraphrase=True) if result is not None else None
+
+
+async def _get_paraphrase(dataset_id: str,
+                          dataset_updated_at: datetime,
+                          question: str,
+                          **params: Any) -> Optional[Dict[str, Any]]:
+    index: List[Dict[str, Any]] = await cache_get_json(
+        _semantic_index_key(dataset_id, dataset_updated_at, **params)
+    ) or []
+    anchors = _anchor_terms(question)
+    # Entries written before the question text was indexed can't be checked
+    candidates = [
+        entry for entry in index
+        if 'question' in entry and _anchor_terms(entry['question']) == anchors
+    ]
+    if not candidates:
+        return None
+
+    query_vector = await _embed_question(question)
+    similarities = np.asarray([entry['embedding'] for entry in candidates], dtype=np.float32) @ query_vector
+    best = int(np.argmax(similarities))
+    if similarities[best] < SEMANTIC_SIMILARITY_THRESHOLD:
+        return None
+
+    return await cache_get_json(candidates[best]['key'])
+
+
+async def set_cached_research(dataset_id: str,
+                              dataset_updated_at: datetime,
+                              question: str,
+                              result: Dict[str, Any],
+                              **params: Any) -> None:
+    """Cache a successful research result and index its question for paraphrase lookups
+
+    Caching is best-effort: a failure here is logged and never loses the
+    result the caller already has.
+    """
+    try:
+        key = research_cache_key(dataset_id, dataset_updated_at, question, **params)
+        await cache_set_json(key, result, ttl=RESEARCH_CACHE_TTL_SECONDS)
+
+        index_key = _semantic_index_key(dataset_id, dataset_updated_at, **params)
+        index = await cache_get_json(index_key) or []
+        index = [entry for entry in index if entry['key'] != key]
+        index.append({
+            'key': key,
+            'question': question,
+            'embedding': (await _embed_question(question)).tolist()
+        })
+        await cache_set_json(index_key, index[-SEMANTIC_INDEX_SIZE:], ttl=RESEARCH_CACHE_TTL_SECONDS)
+    except Exception as e:
+        print(f"Caching research result failed for dataset {dataset_id}: {e}")
+
+
+class StageCache:
+    """Memoizes individual pipeline stages for one dataset version
+
+    With refresh, cached outputs are ignored but fresh ones still replace them.
+    """
+
+    def __init__(self,
+                 dataset_id: str,
+                 dataset_updated_at: datetime,
+                 salt: Optional[str] = None,
+                 refresh: bool = False):
+        self.dataset_id = dataset_id
+        self.dataset_updated_at = dataset_updated_at
+        self.salt = salt
+        self.refresh = refresh
+
+    def _key(self, stage: str, stage_input: str) -> str:
+        digest = _digest({
+            'dataset_updated_at': self.dataset_updated_at.isoformat(),
+            'salt': self.salt,
+            'input': stage_input
+        })
+        return f"research_stage:{self.dataset_id}:{stage}:{digest}"
+
+    async def get_or_compute(self,
+                             stage: str,
+                             stage_input: str,
+                             compute: Callable[[], Awaitable[Any]],
+                             cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Return the cached output for (stage, input) or compute and store it
+
+        Outputs must be JSON-serializable. Empty outputs, and any that
+        cacheable rejects, are returned without being stored, so one bad
+        completion can't stick for the whole TTL.
+        """
+        key = self._key(stage, stage_input)
+        if not self.refresh:
+            cached = await cache_get_json(key)
+            if cached is not None:
+                return cached
+
+        value = await compute()
+        if value and (cacheable is None or cacheable(value)):
+            await cache_set_json(key, value, ttl=STAGE_CACHE_TTL_SECONDS)
+        return value
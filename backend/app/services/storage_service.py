@@ -3,12 +3,24 @@ import json
 import pandas as pd
 import numpy as np
 import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 from app.core.config import settings
 from app.services.profiling_service import ProfilingService
 from app.services.embedding_service import EmbeddingService
 
 
+@lru_cache(maxsize=1024)
+def _read_schema_file(schema_path: str, mtime_ns: int) -> dict:
+    """Parse a schema file; keyed by mtime so a rewritten file is re-read"""
+    with open(schema_path, 'r') as f:
+        return json.load(f)
+
+
 class StorageService:
     """Manages Parquet + JSON + embeddings on filesystem"""
 
@@ -210,15 +222,65 @@ class StorageService:
         return tags
 
     def load_schema(self, dataset_id: str) -> dict:
-        """Load schema JSON for a dataset"""
+        """Load schema JSON for a dataset
+
+        Cached per file modification time; callers must treat the returned
+        dict as read-only.
+        """
         schema_path = f"{settings.DATASETS_DIR}/{dataset_id}/schema.json"
-        with open(schema_path, 'r') as f:
-            return json.load(f)
+        return _read_schema_file(schema_path, os.stat(schema_path).st_mtime_ns)
 
     def load_dataset(self, dataset_id: str) -> pd.DataFrame:
         """Load dataset from Parquet"""
         parquet_path = f"{settings.DATASETS_DIR}/{dataset_id}/data.parquet"
-        return pd.read_parquet(parquet_path)
+        return pd.read_parquet(parquet_path, memory_map=True)
+
+    def load_dataset_head(self, dataset_id: str, n: int) -> Tuple[pd.DataFrame, int]:
+        """Load the first n rows of a dataset plus its total row count"""
+        table, total_rows = self._read_head_table(dataset_id, n)
+        return table.to_pandas(), total_rows
+
+    def load_dataset_preview(self, dataset_id: str, n: int) -> Tuple[List[str], List[Dict[str, Any]], int]:
+        """Load the first n rows as JSON-ready records plus the total row count
+
+        NaN/inf floats become None in a single Arrow pass, skipping the
+        pandas object-dtype round trip.
+        """
+        table, total_rows = self._read_head_table(dataset_id, n)
+
+        for i, field in enumerate(table.schema):
+            if pa.types.is_floating(field.type):
+                column = table.column(i)
+                table = table.set_column(
+                    i, field, pc.if_else(pc.is_finite(column), column, pa.scalar(None, field.type))
+                )
+
+        return table.column_names, table.to_pylist(), total_rows
+
+    def _read_head_table(self, dataset_id: str, n: int) -> Tuple[pa.Table, int]:
+        """Read the first n rows as an Arrow table plus the total row count
+
+        Reads only as many record batches as needed and takes the row count
+        from the Parquet footer, so cost doesn't grow with dataset size.
+        """
+        parquet_path = f"{settings.DATASETS_DIR}/{dataset_id}/data.parquet"
+        parquet_file = pq.ParquetFile(parquet_path, memory_map=True)
+
+        batches = []
+        rows_read = 0
+        if n > 0:
+            for batch in parquet_file.iter_batches(batch_size=n):
+                batches.append(batch)
+                rows_read += batch.num_rows
+                if rows_read >= n:
+                    break
+
+        if batches:
+            table = pa.Table.from_batches(batches).slice(0, n)
+        else:
+            table = parquet_file.schema_arrow.empty_table()
+
+        return table, parquet_file.metadata.num_rows
 
     def save_query_result(self, df: pd.DataFrame, query_id: str) -> str:
         """Save query result to Parquet"""
@@ -229,4 +291,4 @@ class StorageService:
     def load_query_result(self, query_id: str) -> pd.DataFrame:
         """Load query result from Parquet"""
         result_path = f"{settings.QUERIES_DIR}/{query_id}_result.parquet"
-        return pd.read_parquet(result_path)
+        return pd.read_parquet(result_path, memory_map=True)
@@ -1,4 +1,5 @@
 import uuid
+import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from app.services.duckdb_service import DuckDBService
@@ -149,7 +150,8 @@ class WorkflowOrchestrator:
         dataset_id = context['dataset_id']
 
         # Execute SQL query
-        result_df = self.duckdb_service.execute_query(
+        result_df = await asyncio.to_thread(
+            self.duckdb_service.execute_query,
             sql=step.sql,
             dataset_id=dataset_id
         )
@@ -187,7 +189,8 @@ class WorkflowOrchestrator:
                 )
 
         # Execute code
-        execution_result = self.code_executor.execute_python(
+        execution_result = await asyncio.to_thread(
+            self.code_executor.execute_python,
             code=code,
             dataset_id=dataset_id
         )
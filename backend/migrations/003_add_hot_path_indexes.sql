@@ -0,0 +1,20 @@
+-- Migration: Add composite/partial indexes for hot API predicates
+-- Created: 2026-10-16
+--
+-- CONCURRENTLY avoids locking writes on live tables; run this file with psql
+-- directly (not inside a transaction block).
+
+-- Active dataset listing: WHERE deleted_at IS NULL ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_datasets_active_created_at
+    ON datasets(created_at DESC) WHERE deleted_at IS NULL;
+
+-- Rules are always fetched per dataset (column metadata lookups use the
+-- unique (dataset_id, column_name) constraint added in 004)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_query_rules_dataset_priority
+    ON query_rules(dataset_id, priority DESC);
+
+-- Per-dataset history listings: WHERE dataset_id = ? ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_code_executions_dataset_created_at
+    ON code_executions(dataset_id, created_at DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ml_models_active_dataset_created_at
+    ON ml_models(dataset_id, created_at DESC) WHERE status = 'active';
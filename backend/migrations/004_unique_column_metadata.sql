@@ -0,0 +1,18 @@
+-- Migration: Enforce one metadata row per dataset column
+-- Created: 2026-10-16
+--
+-- Required by the column metadata upsert (INSERT ... ON CONFLICT).
+
+-- Keep the most recently updated row for any duplicated column
+DELETE FROM column_metadata a
+USING column_metadata b
+WHERE a.dataset_id = b.dataset_id
+  AND a.column_name = b.column_name
+  AND (a.updated_at, a.id) < (b.updated_at, b.id);
+
+ALTER TABLE column_metadata
+    ADD CONSTRAINT uq_column_metadata_dataset_column UNIQUE (dataset_id, column_name);
+
+-- Only present where an earlier revision of 003 created it; the unique
+-- constraint's index covers the same lookup
+DROP INDEX IF EXISTS idx_column_metadata_dataset_column;